@@ -9,13 +9,26 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import (
     StaleElementReferenceException,
+    ElementClickInterceptedException,
+    SessionNotCreatedException,
+    NoSuchElementException,
     TimeoutException
 )
-from webdriver_manager.chrome import ChromeDriverManager
+import re
 import time
-from typing import Literal
-from datetime import datetime
-from prettytable import PrettyTable
+from typing import Literal, Callable
+import heapq
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import ThreadPoolExecutor
+from BookingsBot.driver_cache import resolve_driver, driver_outdated
+from BookingsBot.price_matrix import PriceMatrix
+from BookingsBot.network_capture import NetworkCapture
+from BookingsBot.sharding import collect_sharded
+from BookingsBot.governor import RateGovernor
+from BookingsBot.tabs import TabScheduler, search_flow, check_source
+from BookingsBot.property_index import PropertyIndex, property_id_from_url
+from BookingsBot.retry import RetryPolicy, DeadlineExceeded
 import BookingsBot.constants as const
 
 class Booking(webdriver.Chrome):
@@ -26,11 +39,44 @@ class Booking(webdriver.Chrome):
     """
 
     # -------------- CONSTRUCTOR --------------
-    def __init__(self, driver_path=None, teardown=False, implicit_wait:int=15):
-        if driver_path is None:
-            driver_path = ChromeDriverManager().install()
+    def __init__(self, driver_path=None, teardown=False, implicit_wait:int=0,
+                 retry_policy: RetryPolicy = None,
+                 user_data_dir: str = None,
+                 profile_directory: str = None,
+                 capture_network: bool = False,
+                 governor: RateGovernor = None,
+                 page_load_strategy: Literal["normal", "eager", "none"] = "normal"):
+        """
+        Args:
+            driver_path (str, optional): ChromeDriver to use. Defaults to the cached
+                driver (see `BookingsBot.driver_cache`), resolved once and reused offline.
+            teardown (bool): Quit the browser when leaving the `with` block.
+            implicit_wait (int): Implicit wait in seconds. Keep it at 0: every lookup
+                uses an explicit wait capped by the retry policy's deadline, and an
+                implicit wait would let single lookups block past it.
+            retry_policy (RetryPolicy, optional): Retry/backoff/deadline policy.
+            user_data_dir (str, optional): Existing Chrome user-data directory to reuse
+                (cookies, consent and currency already set).
+            profile_directory (str, optional): Profile inside `user_data_dir` (e.g. "Default").
+            capture_network (bool): Record network traffic so results can be decoded from
+                the page's JSON responses (see `collect_results`).
+            governor (RateGovernor, optional): Rate governor shared by all sessions.
+                Defaults to the host-wide `RateGovernor.shared()`; False disables it.
+            page_load_strategy (Literal): When navigations return. `run_in_tabs` needs
+                "eager" (DOM ready) or "none"; with "normal" it raises ValueError.
+        """
+        cached_driver = driver_path is None
+        if cached_driver:
+            driver_path = resolve_driver()["driver_path"]
         self.driver_path = driver_path
         self.teardown = teardown
+        self.capture_network = capture_network
+        self.network_capture = NetworkCapture() if capture_network else None
+        self.governor = RateGovernor.shared() if governor is None else governor or None
+        self.active_sort = None
+        self.currency = None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.property_index = PropertyIndex()
 
         options = Options()
 
@@ -38,13 +84,31 @@ class Booking(webdriver.Chrome):
 
         options.add_argument("--ignore-certificate-errors")
 
+        options.page_load_strategy = page_load_strategy
+        self.page_load_strategy = page_load_strategy
+
         if not teardown:
             options.add_experimental_option("detach", True)  # keep browser open
 
-        service = Service(self.driver_path)
-        super().__init__(service=service, options=options)
+        if capture_network:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        if user_data_dir:
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+            if profile_directory:
+                options.add_argument(f"--profile-directory={profile_directory}")
+
+        try:
+            super().__init__(service=Service(self.driver_path), options=options)
+        except SessionNotCreatedException as error:
+            if not cached_driver or not driver_outdated(error.msg):
+                raise
+            # Chrome was updated since the driver was cached
+            self.driver_path = resolve_driver(refresh=True)["driver_path"]
+            super().__init__(service=Service(self.driver_path), options=options)
 
         # Implicit wait for element presence
+        self.implicit_wait = implicit_wait
         self.implicitly_wait(implicit_wait)
 
         # Maximize browser window
@@ -65,63 +129,178 @@ class Booking(webdriver.Chrome):
 
 
 
+    # ---------- RATE GOVERNOR ----------
+    def throttle(self, cost: float = 1.0):
+        """
+        Waits for the shared rate governor before a navigation or heavy interaction.
+        The wait counts against the search deadline.
+        """
+        if self.governor:
+            self.governor.acquire(cost, sleep=self.retry_policy.sleep)
+
+
+    def is_challenge_page(self):
+        """
+        Returns:
+            bool: True if the current page is a challenge / captcha page.
+        """
+        return bool(self.execute_script("return !!document.querySelector(arguments[0]);",
+                                        const.CHALLENGE_SELECTOR))
+
+
+    def _report_load(self, start: float):
+        if self.governor:
+            self.governor.report(time.monotonic() - start, challenged=self.is_challenge_page())
+
+
+    def governed(self, action, wait_time: int = 10):
+        """
+        Runs an interaction that loads new results (search, sort, filter, price slider)
+        through the rate governor: waits for it first, then waits for the results to be
+        replaced or a challenge page to show, and reports the latency and any challenge.
+        A timeout of the interaction itself is reported before it is raised.
+
+        Returns:
+            The value returned by `action`.
+        """
+        loaded = (By.CSS_SELECTOR, f'div[data-testid="property-card"], {const.CHALLENGE_SELECTOR}')
+        previous = self.find_elements(*loaded)[:1]
+
+        self.throttle()
+        start = time.monotonic()
+        try:
+            result = action()
+        except TimeoutException:
+            self._report_load(start)
+            raise
+
+        try:
+            WebDriverWait(self, self.retry_policy.timeout(wait_time)).until(
+                lambda driver: all(EC.staleness_of(element)(driver) for element in previous)
+                               and driver.find_elements(*loaded)
+            )
+        except DeadlineExceeded:
+            raise
+        except TimeoutException:
+            pass    # no results, or the list was updated in place: still report the wait
+        self._report_load(start)
+        return result
+
+
+    def get(self, url: str):
+        """
+        Navigates to `url` through the rate governor and reports the load time
+        and any challenge page back to it.
+        """
+        self.throttle()
+        if self.network_capture:
+            self.network_capture.reset(self)
+        self.set_page_load_timeout(self.retry_policy.timeout(const.PAGE_LOAD_TIMEOUT))
+        start = time.monotonic()
+        try:
+            super().get(url)
+        except TimeoutException as error:
+            if self.retry_policy.remaining() <= 0:
+                raise DeadlineExceeded(f"{const.RED}{const.BOLD}Search exceeded its latency budget.{const.RESET}") from error
+            raise
+        self._report_load(start)
+
+
+
+    def navigate_async(self, url: str):
+        """
+        Starts loading `url` in the current tab and returns without waiting for it.
+        Used by tab flows (see `BookingsBot.tabs`).
+        """
+        self.throttle()
+        if self.network_capture:
+            self.network_capture.reset(self)
+        self.execute_script("window.location.href = arguments[0];", url)
+
+
+
     # ---------- UNIVERSAL SAFE CLICK ----------
-    def safe_click(self, locator, retries=3, wait_time=5):
+    def safe_click(self, locator, retries=None, wait_time=5):
         """
         Clicks an element safely with retries and explicit wait.
         locator: tuple(By.<METHOD>, "selector")
+        Retries, backoff and the search deadline come from `self.retry_policy`.
         """
-        for attempt in range(retries):
-            try:
-                element = WebDriverWait(self, wait_time).until(
-                    EC.element_to_be_clickable(locator)
-                )
-                element.click()
-                return True
-            except StaleElementReferenceException:
-                time.sleep(0.5)
-            except TimeoutException:
-                if attempt == retries - 1:
-                    print(f"Element not found: {const.RED}{const.BOLD}{locator}{const.RESET}")
-                    raise
+        def click():
+            element = WebDriverWait(self, self.retry_policy.timeout(wait_time)).until(
+                EC.element_to_be_clickable(locator)
+            )
+            element.click()
+            return True
+
+        try:
+            return self.retry_policy.run(click, key=locator, retries=retries)
+        except TimeoutException:
+            print(f"Element not found: {const.RED}{const.BOLD}{locator}{const.RESET}")
+            raise
 
 
 
     # ---------- UNIVERSAL SAFE SEND KEYS ----------
-    def safe_send_keys(self, locator, text, retries=3, wait_time=5):
+    def safe_send_keys(self, locator, text, retries=None, wait_time=5):
         """
         Sends text to an input element safely with retries and explicit wait.
         """
-        for attempt in range(retries):
-            try:
-                element = WebDriverWait(self, wait_time).until(
-                    EC.presence_of_element_located(locator)
-                )
-                element.clear()
-                element.send_keys(text)
-                return True
-            except StaleElementReferenceException:
-                time.sleep(0.5)
-            except TimeoutException:
-                if attempt == retries - 1:
-                    print(f"Input element not found: {const.RED}{const.BOLD}{locator}{const.RESET}")
-                    raise
+        def send():
+            element = WebDriverWait(self, self.retry_policy.timeout(wait_time)).until(
+                EC.presence_of_element_located(locator)
+            )
+            element.clear()
+            element.send_keys(text)
+            return True
+
+        try:
+            return self.retry_policy.run(send, key=locator, retries=retries)
+        except TimeoutException:
+            print(f"Input element not found: {const.RED}{const.BOLD}{locator}{const.RESET}")
+            raise
+
+
+
+    # ---------- CLICKABLE PROBE ----------
+    def find_clickable(self, locator, wait_time=2):
+        """
+        Waits briefly for an element to become clickable without retrying.
+
+        Returns:
+            WebElement | None: The element, or None if it did not show up in time.
+        """
+        try:
+            return WebDriverWait(self, self.retry_policy.timeout(wait_time)).until(
+                EC.element_to_be_clickable(locator)
+            )
+        except DeadlineExceeded:
+            raise
+        except TimeoutException:
+            return None
 
 
 
     # ---------- PAGE METHODS ----------
-    def land_first_page(self):
+    def land_first_page(self, search_budget: float = None):
         """
-        Navigates the browser to the base URL (Booking.com home page).
+        Navigates the browser to the base URL (Booking.com home page)
+        and starts the latency budget of a new search.
+
+        Args:
+            search_budget (float, optional): Seconds allowed for this search.
+                Defaults to the retry policy's `search_budget`.
         """
+        self.retry_policy.end_search()
+        self.retry_policy.start_search(search_budget)
         self.get(const.BASE_URL)
-        try:
-            sign_in_info = WebDriverWait(self, 3).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 
-                                        "button[aria-label='Dismiss sign-in info.']")))
-            sign_in_info.click()
-        except:
-            pass
+        sign_in_info = self.find_clickable((By.CSS_SELECTOR, "button[aria-label='Dismiss sign-in info.']"),
+                                           wait_time=3)
+        if sign_in_info:
+            try:
+                sign_in_info.click()
+            except (StaleElementReferenceException, ElementClickInterceptedException):
+                pass
 
 
     # ---------- FETCH ALL CURRENCIES ----------
@@ -140,7 +319,7 @@ class Booking(webdriver.Chrome):
         self.safe_click(currency_button_locator)
 
     
-        select_currency = WebDriverWait(self, 10).until(
+        select_currency = WebDriverWait(self, self.retry_policy.timeout(10)).until(
                           EC.presence_of_all_elements_located(    
                           (By.CSS_SELECTOR, "div.CurrencyPicker_currency")
                           ))
@@ -177,7 +356,25 @@ class Booking(webdriver.Chrome):
         if currency not in const.CURRENCIES:
             raise ValueError(f"Currency {const.RED}{const.BOLD}'{currency}'{const.RESET} is not supported.\n"
                              f" Choose from {const.RED}{const.BOLD}'{const.CURRENCIES}'{const.RESET}")
-        
+
+        self.currency = currency
+
+
+
+    # ---------- CURRENT CURRENCY ----------
+    def current_currency(self):
+        """
+        Returns the currency prices are shown in: the one set with `change_currency`,
+        else the `selected_currency` URL parameter, else the header currency button.
+        """
+        if self.currency:
+            return self.currency
+        query = dict(parse_qsl(urlsplit(self.current_url).query))
+        if query.get("selected_currency"):
+            return query["selected_currency"]
+        currency_button_locator = (By.CSS_SELECTOR, 'button[data-testid="header-currency-picker-trigger"]')
+        return WebDriverWait(self, self.retry_policy.timeout(10)).until(
+            EC.presence_of_element_located(currency_button_locator)).text.strip()
 
 
     # ---------- SEARCH LOCATION ----------
@@ -193,7 +390,7 @@ class Booking(webdriver.Chrome):
         """
         location_input_locator = (By.CSS_SELECTOR,"input[name='ss']")
         self.safe_send_keys(location_input_locator,location)
-        time.sleep(2.5)
+        self.retry_policy.sleep(2.5)
         first_suggestion = (By.CSS_SELECTOR,"li[id='autocomplete-result-0']")
         self.safe_click(first_suggestion)
 
@@ -268,32 +465,28 @@ class Booking(webdriver.Chrome):
             checkout_locator = (By.CSS_SELECTOR,f"span[data-date='{checkout_date}']")
             next_button_locator = (By.CSS_SELECTOR,"button[aria-label='Next month']")
 
-            while True:
-                try:
-                    self.safe_click(checkin_locator)
-                    break
-                except :
-                    try:
-                        self.safe_click(next_button_locator)
-                    except:
-                        raise ValueError(f"{const.RED}{const.BOLD}Checkin Date is out of range.{const.RESET}")
-                    
-            while True:
-                try:
-                    self.safe_click(checkout_locator)
-                    break
-                except :
+            def click_date(locator, label):
+                # Page forward at most MAX_CALENDAR_MONTHS months looking for the date
+                for _ in range(const.MAX_CALENDAR_MONTHS):
+                    if self.find_clickable(locator):
+                        self.safe_click(locator)
+                        return
                     try:
                         self.safe_click(next_button_locator)
-                    except:
-                        raise ValueError(f"{const.RED}{const.BOLD}Checkout Date is out of range.{const.RESET}")
-            
+                    except TimeoutException as error:
+                        if isinstance(error, DeadlineExceeded):
+                            raise
+                        break
+                raise ValueError(f"{const.RED}{const.BOLD}{label} Date is out of range.{const.RESET}")
+
+            click_date(checkin_locator, "Checkin")
+            click_date(checkout_locator, "Checkout")
+
             if flexibility != "Exact dates":
-                try:   
-                    span_locator = (By.XPATH,f"//span[normalize-space(text())='{flexibility}']")
-                    self.safe_click(span_locator)
-                except:
+                if flexibility not in const.DATE_FLEXIBILITY:
                     raise ValueError(f"flexibility must be one of {const.RED}{const.BOLD}{const.DATE_FLEXIBILITY}{const.RESET}")
+                span_locator = (By.XPATH,f"//span[normalize-space(text())='{flexibility}']")
+                self.safe_click(span_locator)
 
 
         elif mode == "flexible":
@@ -310,12 +503,11 @@ class Booking(webdriver.Chrome):
             flexible_button_locator = (By.CSS_SELECTOR,"button[id='flexible-searchboxdatepicker-tab-trigger']")
             self.safe_click(flexible_button_locator)
 
-            try:
-                stay_duration_locator = (By.XPATH,f"//div[text()='{stay_duration}']")
-                self.safe_click(stay_duration_locator)
-                time.sleep(1)
-            except:
+            if stay_duration not in const.STAY_DURATION:
                 raise ValueError(f"Stay Duration must be from : {const.RED}{const.BOLD}{const.STAY_DURATION}{const.RESET}")
+            stay_duration_locator = (By.XPATH,f"//div[text()='{stay_duration}']")
+            self.safe_click(stay_duration_locator)
+            self.retry_policy.sleep(1)
 
             if stay_duration == "Other":
 
@@ -329,13 +521,13 @@ class Booking(webdriver.Chrome):
 
                 input_locator = (By.CSS_SELECTOR,"input[aria-label='Number of nights']")
                 self.safe_click(input_locator)
-                input_box = WebDriverWait(self, 10).until(
+                input_box = WebDriverWait(self, self.retry_policy.timeout(10)).until(
                             EC.visibility_of_element_located(input_locator)
                             )
                 input_box.send_keys(Keys.DELETE)      
                 input_box.send_keys(str(stay_duration_days))  
                 
-                time.sleep(2)
+                self.retry_policy.sleep(2)
                 select_locator = (By.CSS_SELECTOR,"select[aria-label='Check-in day']")
                 self.safe_click(select_locator)
 
@@ -347,26 +539,29 @@ class Booking(webdriver.Chrome):
                 if stay_duration_days or day_number:
                     raise ValueError(f"{const.RED}{const.BOLD}stay_duration_days and day_number arguments are only valid for stay_duration = 'Other'{const.RESET}")
 
-            calendar_container = self.find_element(By.CSS_SELECTOR,"div[data-testid='flexible-dates-months']")
+            calendar_container = WebDriverWait(self, self.retry_policy.timeout(10)).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR,"div[data-testid='flexible-dates-months']")))
             
             staytime = [tuple(i.split(" ")) for i in time_of_stay]
 
+            next_button = (By.CSS_SELECTOR,"button[aria-label='Next']")
             for t in staytime:
                 target_month,target_year = t
-                while True:
-
+                month_locator = (By.XPATH,f".//div[contains(@role,'group') and "
+                                          f".//span[contains(normalize-space(text()),'{target_month}')] and "
+                                          f".//span[contains(normalize-space(text()),'{target_year}')]]")
+                for _ in range(const.MAX_CALENDAR_MONTHS):
                     try:
-                        li = WebDriverWait(calendar_container,5).until(
-                            EC.visibility_of_element_located((By.XPATH,f".//div[contains(@role,'group') and "
-                                                                f".//span[contains(normalize-space(text()),'{target_month}')] and "
-                                                                f".//span[contains(normalize-space(text()),'{target_year}')]]")
-                        ))
-                        li.click()
+                        li = WebDriverWait(calendar_container, self.retry_policy.timeout(5)).until(
+                            EC.visibility_of_element_located(month_locator))
+                        self.retry_policy.run(li.click)
                         break
-                    
-                    except:
-                        next_button = (By.CSS_SELECTOR,"button[aria-label='Next']")
+                    except DeadlineExceeded:
+                        raise
+                    except TimeoutException:
                         self.safe_click(next_button)
+                else:
+                    raise ValueError(f"Month {const.RED}{const.BOLD}'{target_month} {target_year}'{const.RESET} is out of range.")
             select_button_locator = (By.XPATH,"//button//span[normalize-space(text())='Select dates']") 
             self.safe_click(select_button_locator)
         else:
@@ -403,43 +598,25 @@ class Booking(webdriver.Chrome):
 
         for group_name,target_value in groups.items():
 
-            container_locator : WebElement = WebDriverWait(self,10).until(
-                                EC.presence_of_element_located
-                                ((By.XPATH,f"//label[text()='{group_name}']/parent::div/following-sibling::div")))
+            group_locator = (By.XPATH,f"//label[text()='{group_name}']/parent::div/following-sibling::div")
 
-            span_value = container_locator.find_element(By.XPATH,".//span[normalize-space()]")
+            def group_button(xpath):
+                container : WebElement = WebDriverWait(self, self.retry_policy.timeout(10)).until(
+                                EC.presence_of_element_located(group_locator))
+                return container.find_element(By.XPATH, xpath)
 
-            current_value = int(span_value.text)
-            
-            for attempt in range(3):
-                try:
-                    decrement = container_locator.find_element(By.XPATH, ".//button[1]")
-                    increment = container_locator.find_element(By.XPATH, ".//button[last()]")
-                    break
-                except:
-                    print(f"{const.RED}{const.BOLD}Increment/Decrement not found {const.RESET}")
+            current_value = self.retry_policy.run(
+                lambda: int(group_button(".//span[normalize-space()]").text), key=group_locator)
 
             while current_value < target_value:
-                for attempt in range(3):
-                    try:
-                        increment.click()
-                        current_value += 1
-                        time.sleep(0.4)
-                        break
-                    except:
-                        print(f"Element not found: {const.RED}{const.BOLD}'.//button[last()]'{const.RESET}")
-                time.sleep(0.4)
+                self.retry_policy.run(lambda: group_button(".//button[last()]").click(), key=group_locator)
+                current_value += 1
+                self.retry_policy.sleep(0.4)
 
             while current_value > target_value:
-                for attempt in range(3):
-                    try:
-                        decrement.click()
-                        current_value -=1
-                        time.sleep(0.4)
-                        break
-                    except:
-                        print(f"Element not found: {const.RED}{const.BOLD}'.//button[1]'{const.RESET}")
-                time.sleep(0.4)
+                self.retry_policy.run(lambda: group_button(".//button[1]").click(), key=group_locator)
+                current_value -= 1
+                self.retry_policy.sleep(0.4)
 
 
         if children > 0:
@@ -448,7 +625,7 @@ class Booking(webdriver.Chrome):
                 raise ValueError(f"You must provide {const.RED}{const.BOLD}{children}{const.RESET} ages for children ages list.")
 
 
-            child_age_selects = WebDriverWait(self, 10).until(
+            child_age_selects = WebDriverWait(self, self.retry_policy.timeout(10)).until(
             EC.presence_of_all_elements_located((
                 By.XPATH, "//div[contains(@data-testid,'kids-ages-select')]//select[contains(@name,'age')]"
             )))
@@ -484,7 +661,68 @@ class Booking(webdriver.Chrome):
         
         """
         search_box_locator = (By.CSS_SELECTOR,"button[type='submit']")
-        self.safe_click(search_box_locator)
+        self.governed(lambda: self.safe_click(search_box_locator))
+
+
+
+    # ---------- PRICE SLIDER BOUNDS ----------
+    def _price_slider(self, timeout: int = 10, with_handles: bool = False):
+        """
+        Reads the price slider, retrying through `self.retry_policy` while the
+        filters are still being re-rendered.
+
+        Returns:
+            tuple: (container, slider_min, slider_max, step) of the price slider,
+            followed by (min_handle, max_handle, track_width) if `with_handles`.
+        """
+        def read():
+            container = WebDriverWait(self, self.retry_policy.timeout(timeout)).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-testid="filters-group-slider"]'))
+            )
+            min_input = container.find_element(By.CSS_SELECTOR, 'input[aria-label="Min."]')
+            max_input = container.find_element(By.CSS_SELECTOR, 'input[aria-label="Max."]')
+            slider = (container,
+                      int(min_input.get_attribute("min") or 0),
+                      int(max_input.get_attribute("max") or 0),
+                      int(min_input.get_attribute("step") or 1))
+            if not with_handles:
+                return slider
+
+            handles = container.find_elements(By.CSS_SELECTOR, '.fc835e65e6')
+            if len(handles) < 2:
+                raise NoSuchElementException(f"{const.RED}{const.BOLD}Could not locate slider handles.{const.RESET}")
+            track = container.find_element(By.CSS_SELECTOR, '.e7e72a1761')
+            return slider + (handles[0], handles[1], track.size["width"])
+
+        return self.retry_policy.run(read)
+
+
+    def get_price_bounds(self, timeout: int = 10):
+        """
+        Reads the bounds of the price slider on the results page.
+
+        Returns:
+            tuple[int, int, int]: (slider_min, slider_max, step)
+        """
+        return self._price_slider(timeout)[1:]
+
+
+
+    # ---------- RESULTS COUNT ----------
+    def results_count(self, timeout: int = 10):
+        """
+        Reads the number of properties found (e.g. "Paris: 3,456 properties found").
+
+        Returns:
+            int: The reported count, 0 if the page reports no properties.
+        """
+        header = WebDriverWait(self, self.retry_policy.timeout(timeout)).until(
+            EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'found')]"))
+        )
+        match = re.search(r"([\d,.]+)\s+propert", header.text)
+        if not match:
+            return 0
+        return int(re.sub(r"[^\d]", "", match.group(1)))
 
 
 
@@ -497,30 +735,11 @@ class Booking(webdriver.Chrome):
         if min_value >= max_value:
             raise ValueError(f"{const.RED}{const.BOLD}min_value must be < max_value.{const.RESET}")
 
-        wait = WebDriverWait(self, timeout)
         actions = ActionChains(self)
 
-        # --- Helper: Fetch container, inputs, handles, track ---
+        # --- Helper: Fetch container, bounds, handles, track ---
         def get_slider_elements():
-            container = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-testid="filters-group-slider"]'))
-            )
-            min_input = container.find_element(By.CSS_SELECTOR, 'input[aria-label="Min."]')
-            max_input = container.find_element(By.CSS_SELECTOR, 'input[aria-label="Max."]')
-
-            slider_min = int(min_input.get_attribute("min") or 0)
-            slider_max = int(max_input.get_attribute("max") or 0)
-            step = int(min_input.get_attribute("step") or 1)
-
-            handles = container.find_elements(By.CSS_SELECTOR, '.fc835e65e6')
-            if len(handles) < 2:
-                raise RuntimeError(f"{const.RED}{const.BOLD}Could not locate slider handles.{const.RESET}")
-            min_handle, max_handle = handles[0], handles[1]
-
-            track = container.find_element(By.CSS_SELECTOR, '.e7e72a1761')
-            track_width = track.size["width"]
-
-            return container, slider_min, slider_max, step, min_handle, max_handle, track_width
+            return self._price_slider(timeout, with_handles=True)
 
         # --- Helper: Snap value to step ---
         def snap(v, slider_min, slider_max, step):
@@ -545,9 +764,9 @@ class Booking(webdriver.Chrome):
         # --- Move MIN handle ---
         min_percent = (target_min - slider_min) / (slider_max - slider_min)
         # actions.click_and_hold(min_handle).move_by_offset(-track_width, 0).release().perform()
-        time.sleep(0.3)
-        actions.click_and_hold(min_handle).move_by_offset(int(track_width * min_percent), 0).release().perform()
-        time.sleep(2.5)  # allow DOM to update
+        self.retry_policy.sleep(0.3)
+        self.governed(actions.click_and_hold(min_handle).move_by_offset(int(track_width * min_percent), 0).release().perform)
+        self.retry_policy.sleep(2.5)  # allow DOM to update
 
         # --- Re-fetch max handle and track after DOM update ---
         container, slider_min, slider_max, step, min_handle, max_handle, track_width = get_slider_elements()
@@ -560,9 +779,9 @@ class Booking(webdriver.Chrome):
         # --- Move MAX handle ---
         max_percent = (target_max - slider_min) / (slider_max - slider_min)
         # actions.click_and_hold(max_handle).move_by_offset(track_width, 0).release().perform()
-        time.sleep(0.3)
-        actions.click_and_hold(max_handle).move_by_offset(int(track_width * (max_percent - 1)), 0).release().perform()
-        time.sleep(2.5)
+        self.retry_policy.sleep(0.3)
+        self.governed(actions.click_and_hold(max_handle).move_by_offset(int(track_width * (max_percent - 1)), 0).release().perform)
+        self.retry_policy.sleep(2.5)
 
 
 
@@ -577,7 +796,7 @@ class Booking(webdriver.Chrome):
                 raise ValueError(f"{const.RED}{const.BOLD}{filter}{const.RESET} is not supported."
                                  f"Please choose from : {const.RED}{const.BOLD}{const.FILTERS}{const.RESET}")
 
-        filter_containers = WebDriverWait(self,5).until(
+        filter_containers = WebDriverWait(self, self.retry_policy.timeout(5)).until(
             EC.presence_of_all_elements_located((
                 By.XPATH,"//div[@data-testid='filters-group']")))
         
@@ -600,14 +819,12 @@ class Booking(webdriver.Chrome):
 
                     for label in labels:
                         if label.text in filters and label.text not in applied:
-                            label.click()
+                            self.governed(label.click)
                             applied.add(label.text)
-                            time.sleep(3)
+                            self.retry_policy.sleep(3)
                             break
                 except StaleElementReferenceException:
-                    time.sleep(0.3)
-                except TimeoutException:
-                    raise
+                    self.retry_policy.backoff(attempt)
 
             if len(applied) == len(filters):
                 break
@@ -621,58 +838,449 @@ class Booking(webdriver.Chrome):
 
         sort_option = (By.XPATH,f"//div[@data-testid='sorters-dropdown']//li//span[normalize-space(text())='{sort}']")
 
-        self.safe_click(sort_option)
+        self.governed(lambda: self.safe_click(sort_option))
 
         if sort not in const.SORT_LIST:
             raise ValueError(f"Results can be sorted only according to {const.RED}{const.BOLD}{const.SORT_LIST}{const.RESET}")
-        
 
+        self.active_sort = sort
 
-    # ---------- EXTRACT RESULTS ----------
-    def extract_results(self):
+
+    # ---------- PARSE CARD VALUES ----------
+    @staticmethod
+    def parse_price(text: str):
         """
-        Extracts hotel names, review scores, prices and tax information from the search results page.
+        Converts a displayed price (e.g. "₹ 12,345" or "US$1,020") to a float.
+
+        Returns:
+            float | None: The numeric price, or None if the text holds no digits.
+        """
+        digits = "".join(ch for ch in text if ch.isdigit() or ch == ".")
+        try:
+            return float(digits)
+        except ValueError:
+            return None
+
+
+    @staticmethod
+    def parse_score(text: str):
+        """
+        Converts a displayed review score (e.g. "8.6" or "Scored 8.6") to a float.
+
+        Returns:
+            float | None: The numeric score, or None if it cannot be parsed.
+        """
+        for token in text.replace(",", ".").split():
+            try:
+                return float(token)
+            except ValueError:
+                continue
+        return None
+
+
+
+    # ---------- READ ONE PROPERTY CARD ----------
+    def read_card(self, card: WebElement):
+        """
+        Reads the visible fields of a single property card.
 
         Returns:
-            list of dict: A list where each dict contains 'name', 'review_score', 'price' and 'tax_info' of a hotel.
+            dict: 'name', 'review_score', 'price' and 'tax_info' as displayed text,
+            plus the property 'url' and its canonical 'property_id' (None if no link).
+        """
+        fields = {
+            "name": (By.CSS_SELECTOR, 'div[data-testid="title"]'),
+            "review_score": (By.XPATH, './/div[@data-testid="review-score"]/div[@aria-hidden="true"]'),
+            "price": (By.CSS_SELECTOR, 'span[data-testid="price-and-discounted-price"]'),
+            "tax_info": (By.CSS_SELECTOR, 'div[data-testid="taxes-and-charges"]'),
+        }
+        record = {}
+        for key, locator in fields.items():
+            try:
+                record[key] = card.find_element(*locator).text.strip()
+            except:
+                record[key] = "N/A"
+        try:
+            record["url"] = card.find_element(By.CSS_SELECTOR, 'a[data-testid="title-link"]').get_attribute("href")
+        except:
+            record["url"] = None
+        record["property_id"] = property_id_from_url(record["url"])
+        return record
+
+
+
+    # ---------- COLLECT RESULTS ----------
+    def collect_results(self, source: Literal["dom", "network"] = None):
         """
+        Reads every property on the current results page.
+        Every record is also stored in `self.property_index`.
+
+        Args:
+            source (Literal, optional):
+                - "network": decode the JSON responses behind the results list
+                  (needs `capture_network=True`). Records carry numeric prices,
+                  scores and coordinates. Falls back to "dom" if nothing was captured.
+                - "dom": scrape the rendered property cards.
+                Defaults to "network" when network capture is enabled, else "dom".
+
+        Returns:
+            list of dict: One dict per property, as returned by `read_card`
+            (network records carry extra fields, see `network_capture.decode_property`).
+        """
+        if source is None:
+            source = "network" if self.capture_network else "dom"
+        if source not in ("dom", "network"):
+            raise ValueError(f"source must be one of {const.RED}{const.BOLD}{'dom', 'network'}{const.RESET}")
+
+        if source == "network":
+            if not self.capture_network:
+                raise ValueError(f"{const.RED}{const.BOLD}Network extraction needs Booking(capture_network=True).{const.RESET}")
+            results = self.network_capture.results(self)
+            if results:
+                self.property_index.add_many(results)
+                return results
+
         results = []
 
-        hotel_cards = WebDriverWait(self, 10).until(
+        hotel_cards = WebDriverWait(self, self.retry_policy.timeout(10)).until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div[data-testid="property-card"]'))
         )
 
         for card in hotel_cards:
             try:
-                try:
-                    name = card.find_element(By.CSS_SELECTOR, 'div[data-testid="title"]').text.strip()
-                except:
-                    name = "N/A"
-                try:
-                    review_score = card.find_element(By.XPATH, './/div[@data-testid="review-score"]/div[@aria-hidden="true"]').text.strip()
-                except:
-                    review_score = "N/A"
-                try:
-                    price = card.find_element(By.CSS_SELECTOR, 'span[data-testid="price-and-discounted-price"]').text.strip()
-                except:
-                    price = "N/A"
-                try:
-                    tax_info = card.find_element(By.CSS_SELECTOR, 'div[data-testid="taxes-and-charges"]').text.strip()
-                except:
-                    tax_info = "N/A"
-                    
-                hotel_info = [
-                    name,
-                    review_score,
-                    price,
-                    tax_info
-                ]
-                results.append(hotel_info)
+                record = self.read_card(card)
+                self.property_index.add(record)
+                results.append(record)
             except Exception as e:
                 print(f"Error extracting data from a card: {e}")
                 continue
-            
-            table = PrettyTable(field_names=['Hotel Name','Review Score','Price','Taxes'])
-            table.add_rows(results)
 
-        return table
\ No newline at end of file
+        return results
+
+
+
+    # ---------- EXTRACT RESULTS ----------
+    def extract_results(self, source: Literal["dom", "network"] = None):
+        """
+        Extracts hotel names, review scores, prices and tax information from the search results page.
+
+        Args:
+            source (Literal, optional): Where to read results from, see `collect_results`.
+
+        Returns:
+            PrettyTable: One row per hotel with 'Hotel Name', 'Review Score', 'Price' and 'Taxes'.
+        """
+        from prettytable import PrettyTable
+
+        table = PrettyTable(field_names=['Hotel Name','Review Score','Price','Taxes'])
+        for record in self.collect_results(source):
+            table.add_row([record["name"], record["review_score"], record["price"], record["tax_info"]])
+
+        return table
+
+
+
+    # ---------- RESULTS URL ----------
+    def results_url(self, url: str = None, drop: tuple = (), **params):
+        """
+        Returns the results page URL with some query parameters replaced.
+
+        Args:
+            url (str, optional): URL to start from. Defaults to the current URL.
+            drop (tuple): Query parameters to remove.
+            **params: Query parameters to set (e.g. checkin="2026-03-01").
+        """
+        parts = urlsplit(url or self.current_url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                 if k not in params and k not in drop]
+        query.extend((k, str(v)) for k, v in params.items())
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+    @staticmethod
+    def _sweep_columns(checkin_dates: list[str], stay_lengths: list[int]):
+        columns = []
+        for checkin in checkin_dates:
+            try:
+                datetime.strptime(checkin, "%Y-%m-%d")
+            except ValueError:
+                raise ValueError(f"checkin date {const.RED}{const.BOLD}'{checkin}'{const.RESET} is not in the required format {const.RED}{const.BOLD}'yyyy-mm-dd'{const.RESET}")
+            for nights in stay_lengths:
+                if nights < 1 or nights > 90:
+                    raise ValueError(f"Stay lengths must be between {const.RED}{const.BOLD} 1 to 90 {const.RESET} nights.")
+                columns.append((checkin, nights))
+        return columns
+
+
+
+    # ---------- DATE SWEEP ----------
+    def sweep_dates(self, checkin_dates: list[str], stay_lengths: list[int],
+                    columns: list[tuple[str, int]] = None, search_url: str = None,
+                    search_budget: float = None, max_pages: int = None):
+        """
+        Collects prices for many check-in dates and stay lengths from one configured search.
+
+        Run the usual flow (location, guests, search, price range, filters, sort) once,
+        then call this method. Only the `checkin`/`checkout` query parameters of the
+        results URL are changed, so the form is never filled in again.
+
+        Args:
+            checkin_dates (list[str]): Check-in dates in "yyyy-mm-dd" format.
+            stay_lengths (list[int]): Numbers of nights (1–90).
+            columns (list[tuple], optional): Full column layout of the matrix. Only used
+                when the dates are split across sessions.
+            search_url (str, optional): Configured results URL. Defaults to the current URL.
+            search_budget (float, optional): Seconds allowed per date. Without it (and no
+                policy default) all dates share the deadline already running.
+            max_pages (int, optional): Result pages read per date. Defaults to every page
+                up to the listing cap.
+
+        Returns:
+            PriceMatrix: Prices keyed by property id and (checkin_date, nights).
+            Cards without a property link are left out. A date whose page fails to load
+            or runs out of time is skipped, keeping the pages already read.
+        """
+        search_url = search_url or self.current_url
+        sweep = self._sweep_columns(checkin_dates, stay_lengths)
+        matrix = PriceMatrix(columns or sweep)
+
+        for checkin, nights in sweep:
+            checkout = (datetime.strptime(checkin, "%Y-%m-%d") + timedelta(days=nights)).strftime("%Y-%m-%d")
+            date_url = self.results_url(search_url, drop=const.URL_DATE_PARAMS + ("offset",),
+                                        checkin=checkin, checkout=checkout)
+            self.retry_policy.start_search(search_budget)
+            page = 0
+
+            while max_pages is None or page < max_pages:
+                loaded = False
+                try:
+                    self.get(self.results_url(date_url, offset=page * const.RESULTS_PER_PAGE) if page else date_url)
+                    loaded = True
+                    records = self.collect_results()
+                except TimeoutException as error:
+                    if not loaded or isinstance(error, DeadlineExceeded):
+                        print(f"Skipped {const.RED}{const.BOLD}{checkin} (+{nights} nights){const.RESET} "
+                              f"after {page} page(s): {error.msg or type(error).__name__}")
+                    elif not page:
+                        print(f"No results for {const.RED}{const.BOLD}{checkin} (+{nights} nights){const.RESET}")
+                    break
+
+                for record in records:
+                    price = record.get("price_value")
+                    if price is None:
+                        price = self.parse_price(record["price"])
+                    if record["property_id"]:
+                        matrix.set(record["property_id"], (checkin, nights), price)
+
+                page += 1
+                if len(records) < const.RESULTS_PER_PAGE or page * const.RESULTS_PER_PAGE >= const.RESULT_CAP:
+                    break
+
+        return matrix
+
+
+    @classmethod
+    def sweep_dates_in_sessions(cls, search_url: str, checkin_dates: list[str],
+                                stay_lengths: list[int], sessions: int = 2,
+                                search_budget: float = None, max_pages: int = None,
+                                **booking_kwargs):
+        """
+        Spreads a date sweep across several browser sessions running in parallel.
+
+        Args:
+            search_url (str): Configured results URL (e.g. `bot.current_url` after `search_results`).
+            checkin_dates (list[str]): Check-in dates in "yyyy-mm-dd" format.
+            stay_lengths (list[int]): Numbers of nights (1–90).
+            sessions (int): Number of browsers to open.
+            search_budget (float, optional): Seconds allowed per date.
+            max_pages (int, optional): Result pages read per date.
+            **booking_kwargs: Passed to each `Booking` (e.g. driver_path).
+
+        Returns:
+            PriceMatrix: The merged matrix of all sessions.
+        """
+        columns = cls._sweep_columns(checkin_dates, stay_lengths)
+        sessions = max(1, min(sessions, len(checkin_dates)))
+        shares = [checkin_dates[i::sessions] for i in range(sessions)]
+        booking_kwargs["teardown"] = True
+
+        def run(dates):
+            with cls(**booking_kwargs) as bot:
+                return bot.sweep_dates(dates, stay_lengths, columns=columns, search_url=search_url,
+                                       search_budget=search_budget, max_pages=max_pages)
+
+        matrix = PriceMatrix(columns)
+        with ThreadPoolExecutor(max_workers=sessions) as pool:
+            for part in pool.map(run, shares):
+                matrix.merge(part)
+        return matrix
+
+
+
+    # ---------- TOP-K SEARCH ----------
+    def top_k(self, k: int = 10,
+              key: Literal["price", "score", "price_per_score"] = "price",
+              min_score: float = None,
+              max_price: float = None,
+              predicate: Callable[[dict], bool] = None,
+              max_pages: int = None,
+              search_budget: float = None):
+        """
+        Finds the k best properties of the current search while paging through results.
+
+        Cards are ranked as they are read and only the k best are kept in a bounded heap.
+        When the active sort order (see `sort_according`) guarantees that no later card
+        can enter the top-k or pass the price/score limits, paging stops early:
+        "Price (lowest first)" bounds rankings by "price" and "price_per_score", and `max_price`.
+        Other orders (including "Top reviewed", which weights the score by review count)
+        give no bound, so every page up to `max_pages` is read.
+
+        Args:
+            k (int): Number of properties to return.
+            key (Literal): Ranking key, lower price / higher score / lower price per score point is better.
+            min_score (float, optional): Minimum review score.
+            max_price (float, optional): Maximum price.
+            predicate (Callable, optional): Extra condition on the card dict.
+            max_pages (int, optional): Stop after this many result pages.
+            search_budget (float, optional): Starts a new deadline for the whole top-k
+                search. Without it the deadline already running applies.
+
+        Returns:
+            list of dict: Best properties first. Each card dict also carries
+            'price_value' and 'score_value' as floats.
+        """
+        if k < 1:
+            raise ValueError(f"{const.RED}{const.BOLD}k must be at least 1.{const.RESET}")
+        if key not in const.TOP_K_KEYS:
+            raise ValueError(f"key must be one of {const.RED}{const.BOLD}{const.TOP_K_KEYS}{const.RESET}")
+
+        def rank(price, score):
+            if key == "price":
+                return price
+            if key == "score":
+                return None if score is None else -score
+            return None if score is None or price is None or score <= 0 else price / score
+
+        def lower_bound(price):
+            # Best rank any later card can still reach under the active sort
+            sorted_by = const.SORT_BOUNDS.get(self.active_sort)
+            if sorted_by == "price" and price is not None:
+                if max_price is not None and price > max_price:
+                    return float("inf")
+                if key == "price":
+                    return price
+                if key == "price_per_score":
+                    return price / const.MAX_REVIEW_SCORE
+            return None
+
+        if search_budget is not None:
+            self.retry_policy.start_search(search_budget)
+        search_url = self.current_url
+        heap = []  # (-rank, sequence, record), worst kept rank on top
+        seen = set()
+        sequence = 0
+        page = 0
+
+        while max_pages is None or page < max_pages:
+            if page:
+                self.get(self.results_url(search_url, offset=page * const.RESULTS_PER_PAGE))
+            try:
+                cards = WebDriverWait(self, self.retry_policy.timeout(10)).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div[data-testid="property-card"]'))
+                )
+            except DeadlineExceeded:
+                raise
+            except TimeoutException:
+                break
+
+            exhausted = False
+            for card in cards:
+                record = self.read_card(card)
+                price = record["price_value"] = self.parse_price(record["price"])
+                score = record["score_value"] = self.parse_score(record["review_score"])
+
+                bound = lower_bound(price)
+                if bound is not None and (bound == float("inf") or (len(heap) == k and bound >= -heap[0][0])):
+                    exhausted = True
+                    break
+
+                self.property_index.add(record)
+                if record["property_id"]:
+                    if record["property_id"] in seen:
+                        continue
+                    seen.add(record["property_id"])
+
+                if min_score is not None and (score is None or score < min_score):
+                    continue
+                if max_price is not None and (price is None or price > max_price):
+                    continue
+                if predicate is not None and not predicate(record):
+                    continue
+
+                value = rank(price, score)
+                if value is None:
+                    continue
+                sequence += 1
+                if len(heap) < k:
+                    heapq.heappush(heap, (-value, sequence, record))
+                elif value < -heap[0][0]:
+                    heapq.heapreplace(heap, (-value, sequence, record))
+
+            if exhausted or len(cards) < const.RESULTS_PER_PAGE:
+                break
+            page += 1
+
+        return [record for _, _, record in sorted(heap, key=lambda item: (-item[0], item[1]))]
+
+
+
+    # ---------- COLLECT ALL RESULTS ----------
+    def collect_all_results(self, sessions: int = 1, cap: int = None,
+                            search_budget: float = None, **booking_kwargs):
+        """
+        Collects every property of the current search, even beyond the per-search
+        result cap, by splitting it into price bands (see `BookingsBot.sharding`).
+
+        Args:
+            sessions (int): Browsers probing price bands and reading pages in parallel,
+                this one included.
+            cap (int, optional): Most properties one search lists. Defaults to const.RESULT_CAP.
+            search_budget (float, optional): Seconds allowed per page load. Without it (and no
+                policy default) all loads share the deadline already running.
+            **booking_kwargs: Passed to each extra `Booking` (e.g. driver_path).
+
+        Returns:
+            PropertyIndex: All properties found, deduplicated by property id. Its `shards`
+            attribute lists the price bands; a band marked `truncated` still hit the cap
+            and a warning is printed for it.
+        """
+        return collect_sharded(self, sessions=sessions, cap=cap, search_budget=search_budget, **booking_kwargs)
+
+
+
+    # ---------- SEARCHES IN TABS ----------
+    def run_in_tabs(self, search_urls: list[str], source: Literal["dom"] = None):
+        """
+        Runs several searches at once, one per tab of this browser.
+
+        Each configured results URL (e.g. `bot.current_url` after `search_results`, or
+        URLs from `results_url`) is loaded in its own tab. While one tab waits for its
+        results to render the others make progress (see `BookingsBot.tabs.TabScheduler`).
+
+        The browser must be built with `page_load_strategy="eager"` or `"none"`.
+
+        Args:
+            search_urls (list[str]): Results URLs to load.
+            source (Literal, optional): Only "dom" is supported, see `search_flow`.
+
+        Returns:
+            dict: URL -> list of dict records, or the exception that search raised.
+
+        Raises:
+            ValueError: If the page load strategy is "normal" or `source` is "network".
+        """
+        check_source(source)
+        scheduler = TabScheduler(self)
+        for url in search_urls:
+            scheduler.add(search_flow, url, source)
+        return dict(zip(search_urls, scheduler.run()))
@@ -83,4 +83,72 @@ SORT_LIST = [
     "Property rating (low to high)",
     "Property rating and price",
     "Top reviewed"
-]
\ No newline at end of file
+]
+
+# Query parameters that carry the stay dates on the results page
+URL_DATE_PARAMS = ("checkin", "checkout",
+                   "checkin_year", "checkin_month", "checkin_monthday",
+                   "checkout_year", "checkout_month", "checkout_monthday",
+                   "offset")
+
+RESULTS_PER_PAGE = 25
+
+# Most properties a single search will list
+RESULT_CAP = 1000
+
+MAX_REVIEW_SCORE = 10
+
+TOP_K_KEYS = ["price", "score", "price_per_score"]
+
+# Sort orders that guarantee a monotone card value, used to stop paging early.
+# "Top reviewed" is left out: it ranks by a review-count weighted score, so the
+# displayed score is not monotone down the list.
+SORT_BOUNDS = {
+    "Price (lowest first)": "price",
+}
+
+# Longest a page load may take (also capped by the search deadline)
+PAGE_LOAD_TIMEOUT = 60
+
+# Upper bound on months paged through in the date pickers
+MAX_CALENDAR_MONTHS = 16
+
+CACHE_DIR_NAME = "BookingsBot"
+
+DRIVER_CACHE_FILE = "driver.json"
+
+# ChromeDriver's message when it does not match the installed Chrome
+DRIVER_MISMATCH_TEXT = "only supports Chrome version"
+
+# Endpoints whose JSON responses carry the search results list
+RESULTS_DATA_URL_PATTERNS = ["/dml/graphql"]
+
+# Host-wide rate governor (tokens are navigations / heavy interactions)
+GOVERNOR_STATE_FILE = "governor.json"
+
+GOVERNOR_RATE = 1.0             # tokens per second to start with
+
+GOVERNOR_BURST = 5.0
+
+GOVERNOR_MIN_RATE = 0.05
+
+GOVERNOR_MAX_RATE = 4.0
+
+GOVERNOR_RATE_STEP = 0.05       # additive increase after a normal page load
+
+GOVERNOR_SLOW_FACTOR = 0.8      # multiplicative decrease after a slow page load
+
+GOVERNOR_CHALLENGE_FACTOR = 0.5 # multiplicative decrease after a challenge page
+
+GOVERNOR_SLOW_LATENCY = 10.0    # seconds
+
+GOVERNOR_WAITER_TTL = 300       # seconds before a waiter is assumed dead
+
+# Signs that a challenge / captcha page was served instead of the real page
+CHALLENGE_SELECTOR = "iframe[src*='captcha'], iframe[title*='challenge'], #challenge-container, #px-captcha"
+
+# Seconds a tab may wait for its page before the flow is failed
+TAB_WAIT_TIMEOUT = 30
+
+# Page load strategies that let commands run while other tabs are loading
+TAB_PAGE_LOAD_STRATEGIES = ["eager", "none"]
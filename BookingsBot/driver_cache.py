@@ -0,0 +1,90 @@
+# On-disk cache of the resolved ChromeDriver path and browser version
+import json
+import os
+import re
+import BookingsBot.constants as const
+
+
+def cache_dir():
+    """
+    Returns:
+        str: Directory holding BookingsBot's local state (driver cache, rate governor).
+            Override with the BOOKINGSBOT_CACHE environment variable.
+    """
+    path = os.environ.get("BOOKINGSBOT_CACHE")
+    if not path:
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") \
+               or os.path.join(os.path.expanduser("~"), ".cache")
+        path = os.path.join(base, const.CACHE_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _cache_file():
+    return os.path.join(cache_dir(), const.DRIVER_CACHE_FILE)
+
+
+def load_cached_driver():
+    """
+    Returns:
+        dict | None: {'driver_path', 'browser_version'} if a usable cached driver exists.
+    """
+    try:
+        with open(_cache_file(), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not os.path.isfile(cached.get("driver_path") or ""):
+        return None
+    return cached
+
+
+def refresh_driver():
+    """
+    Resolves the ChromeDriver matching the installed Chrome (may use the network)
+    and stores the result in the cache.
+
+    Returns:
+        dict: {'driver_path', 'browser_version'}
+    """
+    # Imported here so that normal start-up never loads webdriver_manager
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    manager = ChromeDriverManager()
+    resolved = {
+        "driver_path": manager.install(),
+        "browser_version": manager.driver.get_browser_version_from_os(),
+    }
+    with open(_cache_file(), "w", encoding="utf-8") as f:
+        json.dump(resolved, f)
+    return resolved
+
+
+def driver_outdated(error_message: str):
+    """
+    Tells whether a failed browser start was caused by Chrome being updated past
+    the cached driver, as opposed to bad flags, a profile in use, etc.
+
+    Returns:
+        bool: True only for a driver/browser version mismatch with a browser version
+            different from the cached one.
+    """
+    if const.DRIVER_MISMATCH_TEXT not in (error_message or ""):
+        return False
+    cached = load_cached_driver()
+    current = re.search(r"Current browser version is ([\d.]+)", error_message)
+    if cached and current and cached.get("browser_version"):
+        return current.group(1) != cached["browser_version"]
+    return True
+
+
+def resolve_driver(refresh: bool = False):
+    """
+    Returns the cached ChromeDriver, resolving it only when there is no cache yet
+    or when `refresh` is True.
+
+    Returns:
+        dict: {'driver_path', 'browser_version'}
+    """
+    cached = None if refresh else load_cached_driver()
+    return cached or refresh_driver()
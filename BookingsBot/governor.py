@@ -0,0 +1,149 @@
+# Host-wide request rate governor shared by all Booking sessions
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from BookingsBot.driver_cache import cache_dir
+import BookingsBot.constants as const
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
+
+
+class RateGovernor:
+    """
+    Token bucket shared by every process on the host through a locked state file.
+
+    Each navigation or heavy interaction takes tokens with `acquire`. The refill rate
+    adapts to what `report` sees: it is cut sharply when a challenge page is served,
+    reduced when pages load abnormally slowly, and raised slowly otherwise.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str = None,
+                 rate: float = const.GOVERNOR_RATE,
+                 burst: float = const.GOVERNOR_BURST,
+                 min_rate: float = const.GOVERNOR_MIN_RATE,
+                 max_rate: float = const.GOVERNOR_MAX_RATE,
+                 slow_latency: float = const.GOVERNOR_SLOW_LATENCY):
+        self.path = path or os.path.join(cache_dir(), const.GOVERNOR_STATE_FILE)
+        self.initial_rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.slow_latency = slow_latency
+        self._thread_lock = threading.Lock()
+
+
+    @classmethod
+    def shared(cls, path: str = None):
+        """
+        Returns:
+            RateGovernor: One instance per state file and process.
+        """
+        with cls._shared_lock:
+            key = path or os.path.join(cache_dir(), const.GOVERNOR_STATE_FILE)
+            if key not in cls._shared:
+                cls._shared[key] = cls(key)
+            return cls._shared[key]
+
+
+    # ---------- SHARED STATE ----------
+    @contextmanager
+    def _state(self):
+        """
+        Locks the state file across processes and yields its decoded contents,
+        refilled up to now. Changes to the dict are written back on exit.
+        """
+        with self._thread_lock, open(self.path + ".lock", "a+") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        state = json.load(f)
+                except (OSError, ValueError):
+                    state = {"rate": self.initial_rate, "tokens": self.burst,
+                             "updated": time.time(), "waiters": {}}
+
+                now = time.time()
+                state["tokens"] = min(self.burst, state["tokens"] + (now - state["updated"]) * state["rate"])
+                state["updated"] = now
+                state["waiters"] = {k: t for k, t in state["waiters"].items()
+                                    if now - t < const.GOVERNOR_WAITER_TTL}
+                yield state
+
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+    # ---------- ACQUIRE ----------
+    def acquire(self, cost: float = 1.0, sleep=time.sleep):
+        """
+        Blocks until `cost` tokens are available and takes them.
+
+        Args:
+            cost (float): Tokens to take (1 per navigation).
+            sleep (callable): Used to wait, e.g. `RetryPolicy.sleep` so the wait
+                counts against the search deadline.
+        """
+        waiter = f"{os.getpid()}:{threading.get_ident()}"
+        try:
+            while True:
+                with self._state() as state:
+                    if state["tokens"] >= cost:
+                        state["tokens"] -= cost
+                        state["waiters"].pop(waiter, None)
+                        return
+                    state["waiters"][waiter] = time.time()
+                    wait = (cost - state["tokens"]) / state["rate"]
+                sleep(wait)
+        except BaseException:
+            with self._state() as state:
+                state["waiters"].pop(waiter, None)
+            raise
+
+
+    # ---------- ADAPT ----------
+    def report(self, latency: float, challenged: bool = False):
+        """
+        Adapts the shared rate to the outcome of one navigation.
+
+        Args:
+            latency (float): Seconds the page took to load.
+            challenged (bool): True if a challenge/captcha page was served.
+        """
+        with self._state() as state:
+            if challenged:
+                state["rate"] = max(self.min_rate, state["rate"] * const.GOVERNOR_CHALLENGE_FACTOR)
+                state["tokens"] = 0
+            elif latency > self.slow_latency:
+                state["rate"] = max(self.min_rate, state["rate"] * const.GOVERNOR_SLOW_FACTOR)
+            else:
+                state["rate"] = min(self.max_rate, state["rate"] + const.GOVERNOR_RATE_STEP)
+
+
+    def stats(self):
+        """
+        Returns:
+            dict: Current 'rate' (tokens/s), available 'tokens' and 'queue_depth'
+            (callers waiting on any process).
+        """
+        with self._state() as state:
+            return {"rate": state["rate"], "tokens": state["tokens"],
+                    "queue_depth": len(state["waiters"])}
@@ -0,0 +1,160 @@
+# Decode search results from the page's own JSON responses (Chrome performance log)
+import json
+from BookingsBot.property_index import property_id_from_url
+import BookingsBot.constants as const
+
+
+def dig(data, *path, default=None):
+    """
+    Follows a path of dict keys / list indexes, returning `default` if any step is missing.
+    """
+    for step in path:
+        try:
+            data = data[step]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return default if data is None else data
+
+
+def find_property_items(payload):
+    """
+    Walks a decoded JSON payload and yields every search result object
+    (the dicts carrying 'basicPropertyData').
+    """
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get("basicPropertyData"), dict):
+                yield node
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def decode_property(item: dict):
+    """
+    Converts one search result object into a card record.
+
+    Returns:
+        dict: Same keys as `Booking.read_card` plus numeric 'price_value', 'score_value',
+        'currency', 'latitude', 'longitude', 'hotel_id' and 'reviews_count'.
+    """
+    basic = item["basicPropertyData"]
+    country = dig(basic, "location", "countryCode")
+    page_name = basic.get("pageName")
+    url = f"{const.BASE_URL}/hotel/{country}/{page_name}.html" if country and page_name else None
+
+    amount = dig(item, "priceDisplayInfoIrene", "displayPrice", "amountPerStay")
+    score = dig(basic, "reviews", "totalScore")
+
+    return {
+        "name": dig(item, "displayName", "text", default="N/A"),
+        "review_score": "N/A" if score is None else str(score),
+        "price": dig(amount, "amount", default="N/A"),
+        "tax_info": dig(item, "priceDisplayInfoIrene", "excludedCharges",
+                        "excludeChargesAggregated", "amountPerStay", "amount", default="N/A"),
+        "url": url,
+        "property_id": property_id_from_url(url),
+        "hotel_id": basic.get("id"),
+        "price_value": dig(amount, "amountUnformatted"),
+        "currency": dig(amount, "currency"),
+        "score_value": score,
+        "reviews_count": dig(basic, "reviews", "reviewsCount"),
+        "latitude": dig(basic, "location", "latitude"),
+        "longitude": dig(basic, "location", "longitude"),
+    }
+
+
+def results_payload_requests(performance_log: list[dict], loader_id: str = None):
+    """
+    Picks the JSON responses that may carry results data for the current document.
+
+    A main-frame navigation ("Page.frameNavigated" without a parent frame) starts a
+    new document: responses seen before it, or loaded by another document, are dropped.
+
+    Args:
+        performance_log (list[dict]): Entries of the "performance" log.
+        loader_id (str, optional): Loader of the current document, if already known.
+
+    Returns:
+        tuple[list[str], str]: DevTools request ids (oldest first) and the loader id
+        of the current document.
+    """
+    request_ids = []
+    for entry in performance_log:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        method = message.get("method")
+        if method == "Page.frameNavigated":
+            frame = dig(message, "params", "frame", default={})
+            if not frame.get("parentId"):
+                loader_id = frame.get("loaderId")
+                request_ids = []
+            continue
+        if method != "Network.responseReceived":
+            continue
+        params = message.get("params", {})
+        if loader_id and params.get("loaderId") != loader_id:
+            continue
+        response = params.get("response", {})
+        if "json" not in response.get("mimeType", ""):
+            continue
+        if not any(pattern in response.get("url", "") for pattern in const.RESULTS_DATA_URL_PATTERNS):
+            continue
+        request_ids.append(params["requestId"])
+    return request_ids, loader_id
+
+
+class NetworkCapture:
+    """
+    Decodes results from the performance log of one browser, tied to the document
+    currently shown. Reading the log drains it, so the last decoded results of the
+    current document are kept for repeated calls.
+    """
+
+    def __init__(self):
+        self.loader_id = None
+        self.records = []
+
+
+    def reset(self, driver):
+        """
+        Drops everything logged so far. Called before each navigation so payloads of
+        the previous page can never be taken for the next one.
+        """
+        driver.get_log("performance")
+        self.loader_id = None
+        self.records = []
+
+
+    def results(self, driver):
+        """
+        Decodes the most recent results payload of the current document.
+
+        Booking.com replaces the whole list on every response, so only the latest
+        payload that contains properties describes the page currently shown.
+
+        Returns:
+            list of dict: Decoded records, or an empty list if no payload was captured.
+        """
+        loader_id = self.loader_id
+        request_ids, self.loader_id = results_payload_requests(driver.get_log("performance"), loader_id)
+        if self.loader_id != loader_id:
+            self.records = []
+
+        for request_id in reversed(request_ids):
+            try:
+                body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                payload = json.loads(body["body"])
+            except Exception:
+                # Body evicted from the buffer, or not valid JSON
+                continue
+            records = [decode_property(item) for item in find_property_items(payload)]
+            if records:
+                self.records = records
+                break
+        return list(self.records)
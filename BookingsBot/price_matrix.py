@@ -0,0 +1,119 @@
+# Dense property x date price matrix
+from array import array
+import json
+import math
+import struct
+import sys
+
+
+class PriceMatrix:
+    """
+    Dense property x date price matrix backed by a flat `array('d')`.
+
+    Columns are (checkin_date, nights) pairs, rows are properties.
+    Missing prices are stored as NaN.
+    """
+
+    MAGIC = b"BKPM"
+
+    def __init__(self, columns: list[tuple[str, int]]):
+        self.columns = [(str(checkin), int(nights)) for checkin, nights in columns]
+        self._column_index = {column: i for i, column in enumerate(self.columns)}
+        self.properties = []
+        self._row_index = {}
+        self.prices = array("d")
+
+
+    def __len__(self):
+        return len(self.properties)
+
+
+    def _column(self, column):
+        column = (str(column[0]), int(column[1]))
+        if column not in self._column_index:
+            raise KeyError(f"Unknown column {column}")
+        return self._column_index[column]
+
+
+    def add_property(self, key: str):
+        """
+        Adds a row for `key` (filled with NaN) if it is not there yet.
+
+        Returns:
+            int: The row index of the property.
+        """
+        if key not in self._row_index:
+            self._row_index[key] = len(self.properties)
+            self.properties.append(key)
+            self.prices.extend([math.nan] * len(self.columns))
+        return self._row_index[key]
+
+
+    def set(self, key: str, column: tuple[str, int], price: float):
+        row = self.add_property(key)
+        self.prices[row * len(self.columns) + self._column(column)] = math.nan if price is None else price
+
+
+    def get(self, key: str, column: tuple[str, int]):
+        if key not in self._row_index:
+            return None
+        value = self.prices[self._row_index[key] * len(self.columns) + self._column(column)]
+        return None if math.isnan(value) else value
+
+
+    def row(self, key: str):
+        """
+        Returns:
+            list: Prices of one property across all columns (None where missing).
+        """
+        return [self.get(key, column) for column in self.columns]
+
+
+    def merge(self, other: "PriceMatrix"):
+        """
+        Copies every known price of `other` into this matrix.
+        Both matrices must share the same columns.
+        """
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge price matrices with different columns.")
+        for key in other.properties:
+            for column in self.columns:
+                price = other.get(key, column)
+                if price is not None:
+                    self.set(key, column, price)
+        return self
+
+
+    # ---------- SAVE / LOAD ----------
+    def save(self, path: str):
+        """
+        Writes the matrix as a small JSON header followed by the float64 array,
+        both little-endian whatever the machine.
+        """
+        header = json.dumps({"columns": self.columns, "properties": self.properties}).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            prices = self.prices
+            if sys.byteorder == "big":
+                prices = array("d", prices)
+                prices.byteswap()
+            prices.tofile(f)
+
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, "rb") as f:
+            if f.read(4) != cls.MAGIC:
+                raise ValueError(f"{path} is not a saved price matrix.")
+            (header_size,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_size).decode("utf-8"))
+            matrix = cls([tuple(column) for column in header["columns"]])
+            for key in header["properties"]:
+                matrix._row_index[key] = len(matrix.properties)
+                matrix.properties.append(key)
+            matrix.prices.fromfile(f, len(matrix.properties) * len(matrix.columns))
+            if sys.byteorder == "big":
+                matrix.prices.byteswap()
+        return matrix
@@ -0,0 +1,114 @@
+# Index of properties keyed by their canonical Booking.com id
+import gzip
+import json
+import time
+from urllib.parse import urlsplit
+
+
+def property_id_from_url(url: str):
+    """
+    Extracts the canonical property id from a property link.
+
+    "https://www.booking.com/hotel/fr/le-petit.en-gb.html?aid=..." -> "fr/le-petit"
+
+    Returns:
+        str | None: "<country>/<page name>", or None if the link is not a property page.
+    """
+    if not url:
+        return None
+    parts = urlsplit(url).path.strip("/").split("/")
+    if len(parts) != 3 or parts[0] != "hotel":
+        return None
+    country, page = parts[1], parts[2]
+    page = page.split(".")[0]   # drop ".html" and language suffixes like ".en-gb"
+    if not page:
+        return None
+    return f"{country}/{page}".lower()
+
+
+class PropertyIndex:
+    """
+    Latest observation of every property, keyed by property id.
+
+    Adding the same property again (from another page, sort or search) replaces
+    the stored record only if the new observation is at least as recent.
+    Records without a property id are skipped: display names are not unique.
+    """
+
+    def __init__(self, records: list[dict] = None):
+        self._records = {}
+        if records:
+            self.add_many(records)
+
+
+    def __len__(self):
+        return len(self._records)
+
+
+    def __contains__(self, property_id):
+        return property_id in self._records
+
+
+    def __iter__(self):
+        return iter(self._records.values())
+
+
+    def get(self, property_id: str, default=None):
+        return self._records.get(property_id, default)
+
+
+    def add(self, record: dict):
+        """
+        Stores a copy of `record`, stamped with 'observed_at' if it has none.
+
+        Returns:
+            bool: True if the property was not in the index before
+            (False for records without a property id, which are not stored).
+        """
+        key = record.get("property_id")
+        if not key:
+            return False
+        record = dict(record)
+        record.setdefault("observed_at", time.time())
+        current = self._records.get(key)
+        if current is None or record["observed_at"] >= current["observed_at"]:
+            self._records[key] = record
+        return current is None
+
+
+    def add_many(self, records: list[dict]):
+        """
+        Returns:
+            list of dict: The given records whose property was new to the index.
+        """
+        return [record for record in records if self.add(record)]
+
+
+    def merge(self, other: "PropertyIndex"):
+        for record in other:
+            self.add(record)
+        return self
+
+
+    def records(self):
+        return list(self._records.values())
+
+
+    # ---------- SAVE / LOAD ----------
+    def save(self, path: str):
+        """
+        Writes the index as gzip-compressed JSON lines.
+        """
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for record in self._records.values():
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+    @classmethod
+    def load(cls, path: str):
+        index = cls()
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    index.add(json.loads(line))
+        return index
@@ -0,0 +1,167 @@
+# Retry, backoff and deadline policy shared by all Booking interactions
+import random
+import time
+from selenium.common.exceptions import (
+    TimeoutException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+)
+import BookingsBot.constants as const
+
+
+class DeadlineExceeded(TimeoutException):
+    """Raised when a search has used up its latency budget."""
+
+
+class CircuitOpenError(TimeoutException):
+    """Raised when a locator has failed too often and is temporarily skipped."""
+
+
+class RetryPolicy:
+    """
+    Retry policy used by every Booking interaction.
+
+    - Retryable errors (stale, intercepted, not yet present/interactable, timeouts)
+      are retried with exponential backoff and jitter; any other error is fatal.
+    - A locator that keeps failing opens a circuit breaker and fails immediately
+      until `breaker_cooldown` seconds have passed.
+    - `start_search` sets an overall deadline; every wait and sleep is capped by
+      the time left and raises `DeadlineExceeded` once it is used up. Booking only
+      uses explicit waits, so nothing can block past the deadline.
+    """
+
+    RETRYABLE = (
+        StaleElementReferenceException,
+        ElementClickInterceptedException,
+        ElementNotInteractableException,
+        NoSuchElementException,
+        TimeoutException,
+    )
+
+    def __init__(self, retries: int = 3,
+                 base_delay: float = 0.5,
+                 max_delay: float = 4.0,
+                 jitter: float = 0.5,
+                 search_budget: float = None,
+                 breaker_threshold: int = 3,
+                 breaker_cooldown: float = 60.0):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.search_budget = search_budget
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.deadline = None
+        self._failures = {}
+        self._opened_at = {}
+
+
+    # ---------- DEADLINE ----------
+    def start_search(self, budget: float = None):
+        """
+        Starts the latency budget of a new search. Without a budget (and no
+        `search_budget` default) the deadline already running is kept.
+        """
+        budget = budget if budget is not None else self.search_budget
+        if budget is not None:
+            self.deadline = time.monotonic() + budget
+
+
+    def end_search(self):
+        """
+        Clears the deadline, waits are no longer limited.
+        """
+        self.deadline = None
+
+
+    def remaining(self):
+        if self.deadline is None:
+            return float("inf")
+        return self.deadline - time.monotonic()
+
+
+    def timeout(self, requested: float):
+        """
+        Returns:
+            float: `requested` capped by the time left in the search budget.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"{const.RED}{const.BOLD}Search exceeded its latency budget.{const.RESET}")
+        return min(requested, remaining)
+
+
+    def sleep(self, seconds: float):
+        time.sleep(self.timeout(seconds))
+
+
+    def backoff(self, attempt: int):
+        """
+        Sleeps before retry number `attempt` (0-based), doubling the delay each time.
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        self.sleep(delay * (1 - self.jitter * random.random()))
+
+
+    # ---------- CLASSIFICATION ----------
+    def is_retryable(self, error: Exception):
+        return isinstance(error, self.RETRYABLE) and not isinstance(error, (DeadlineExceeded, CircuitOpenError))
+
+
+    # ---------- CIRCUIT BREAKER ----------
+    def _check_breaker(self, key):
+        opened_at = self._opened_at.get(key)
+        if opened_at is None:
+            return
+        if time.monotonic() - opened_at < self.breaker_cooldown:
+            raise CircuitOpenError(f"Skipping repeatedly failing locator: {const.RED}{const.BOLD}{key}{const.RESET}")
+        # Half-open: allow one more try
+        del self._opened_at[key]
+        self._failures[key] = self.breaker_threshold - 1
+
+
+    def _record(self, key, success: bool):
+        if key is None:
+            return
+        if success:
+            self._failures.pop(key, None)
+            self._opened_at.pop(key, None)
+            return
+        self._failures[key] = self._failures.get(key, 0) + 1
+        if self._failures[key] >= self.breaker_threshold:
+            self._opened_at[key] = time.monotonic()
+
+
+    # ---------- RUN ----------
+    def run(self, action, key=None, retries: int = None):
+        """
+        Calls `action()` until it succeeds, retrying retryable errors.
+
+        Args:
+            action (callable): The interaction to perform.
+            key (hashable, optional): Circuit breaker key, usually the locator.
+            retries (int, optional): Attempts for this call. Defaults to `self.retries`.
+
+        Returns:
+            The return value of `action`.
+        """
+        retries = retries or self.retries
+        if key is not None:
+            self._check_breaker(key)
+
+        for attempt in range(retries):
+            self.timeout(0)
+            try:
+                result = action()
+            except Exception as error:
+                if not self.is_retryable(error) or attempt == retries - 1:
+                    if self.is_retryable(error):
+                        self._record(key, success=False)
+                    raise
+                self.backoff(attempt)
+            else:
+                self._record(key, success=True)
+                return result
@@ -0,0 +1,213 @@
+# Split one search into price bands so every property gets listed
+import math
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+from BookingsBot.property_index import PropertyIndex
+import BookingsBot.constants as const
+
+
+class PriceShard:
+    """
+    One price band of a sharded search.
+
+    Attributes:
+        low, high (int): Price bounds. `high` is None for the open-ended top band.
+        url (str): Results URL of the band.
+        count (int): Number of properties Booking.com reports for the band.
+        records (list of dict): Properties read from the band's first page when it was probed.
+        truncated (bool): True if the band still hits the cap but cannot be split
+            further, so properties past the cap are missing.
+    """
+
+    def __init__(self, low: int, high: int, url: str, count: int, records: list[dict],
+                 truncated: bool = False):
+        self.low = low
+        self.high = high
+        self.url = url
+        self.count = count
+        self.records = records
+        self.truncated = truncated
+
+    def __repr__(self):
+        return f"PriceShard({self.low}-{self.high or 'max'}, count={self.count}" \
+               f"{', truncated' if self.truncated else ''})"
+
+    def remaining_pages(self):
+        """
+        Returns:
+            list[int]: Offsets of the pages not read when the band was probed.
+        """
+        listed = min(self.count, const.RESULT_CAP)
+        return list(range(const.RESULTS_PER_PAGE, listed, const.RESULTS_PER_PAGE))
+
+
+def price_band_url(bot, search_url: str, currency: str, low: int, high: int = None):
+    """
+    Returns `search_url` with its price filter replaced by the band low–high.
+    """
+    query = dict(parse_qsl(urlsplit(search_url).query))
+    filters = [f for f in query.get("nflt", "").split(";") if f and not f.startswith("price=")]
+    filters.append(f"price={currency}-{low}-{'max' if high is None else high}-1")
+    return bot.results_url(search_url, drop=("offset",),
+                           nflt=";".join(filters), selected_currency=currency)
+
+
+def active_price_band(search_url: str):
+    """
+    Reads the price filter already applied to a search (e.g. with
+    `Booking.set_price_slider`), "nflt=price=EUR-50-200-1" -> ("EUR", 50, 200).
+
+    Returns:
+        tuple | None: (currency, low, high), `high` None for an open-ended filter,
+        or None if the search has no price filter.
+    """
+    query = dict(parse_qsl(urlsplit(search_url).query))
+    for f in query.get("nflt", "").split(";"):
+        match = re.fullmatch(r"price=([A-Za-z]+)-(\d+)-(\d+|max)-\d+", f)
+        if match:
+            currency, low, high = match.groups()
+            return currency, int(low), None if high == "max" else int(high)
+    return None
+
+
+def split_band(low: int, high: int, count: int, slider_max: int, step: int, cap: int):
+    """
+    Splits a band that hits the cap. A band reporting n times the cap is cut into
+    n equal parts at once, so dense destinations need few probe loads.
+
+    Returns:
+        list[tuple]: Sub-bands (low, high), or an empty list if the band is a single
+        step wide and cannot be split.
+    """
+    upper = slider_max if high is None else high
+    if upper - low <= step:
+        return []
+    parts = max(2, math.ceil(count / cap))
+    width = max(step, (upper - low) // parts // step * step)
+    edges = list(range(low, upper, width)) + [high]
+    return [(edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+
+def probe_band(worker, search_url: str, currency: str, band: tuple, slider_max: int,
+               step: int, cap: int, search_budget: float = None):
+    """
+    Loads one band's first results page.
+
+    Returns:
+        tuple: (PriceShard, []) if the band is accepted, or (None, sub-bands) if it
+        hits the cap and has to be split.
+    """
+    low, high = band
+    url = price_band_url(worker, search_url, currency, low, high)
+    worker.retry_policy.start_search(search_budget)
+    worker.get(url)
+    count = worker.results_count()
+
+    if count >= cap:
+        bands = split_band(low, high, count, slider_max, step, cap)
+        if bands:
+            return None, bands
+        print(f"Price band {const.RED}{const.BOLD}{low}-{high or 'max'} {currency}{const.RESET} lists "
+              f"{count} properties but cannot be split further: only the first {cap} are collected.")
+        return PriceShard(low, high, url, count, worker.collect_results(), truncated=True), []
+
+    return PriceShard(low, high, url, count, worker.collect_results() if count else []), []
+
+
+def collect_sharded(bot, sessions: int = 1, cap: int = None, search_budget: float = None, **booking_kwargs):
+    """
+    Collects every property of the current search by price-band sharding.
+
+    Bands start from the price filter already applied to the search, or from the
+    slider bounds (`Booking.get_price_bounds`) if there is none. Probing a band
+    also reads its first page; bands that hit the cap are split and their sub-bands
+    probed in turn, and the remaining pages of accepted bands are queued. Probes
+    and pages are shared by `bot` and `sessions - 1` extra browsers running in
+    parallel, so sibling bands are probed at the same time.
+
+    Returns:
+        PropertyIndex: All properties found, deduplicated by property id.
+        `index.shards` lists the accepted PriceShard bands.
+    """
+    cap = cap or const.RESULT_CAP
+    search_url = bot.current_url
+    slider_min, slider_max, step = bot.get_price_bounds()
+    active = active_price_band(search_url)
+    if active:
+        currency, low, high = active
+    else:
+        currency, low, high = bot.current_currency(), slider_min, None
+    sessions = max(1, sessions)
+    booking_kwargs["teardown"] = True
+
+    index = PropertyIndex()
+    shards = []
+    errors = []
+    tasks = queue.Queue()
+    lock = threading.Lock()
+    outstanding = [0]
+
+    def submit(task):
+        with lock:
+            outstanding[0] += 1
+        tasks.put(task)
+
+    def finish():
+        with lock:
+            outstanding[0] -= 1
+            done = outstanding[0] == 0
+        if done:
+            for _ in range(sessions):
+                tasks.put(None)     # wake every worker up to stop
+
+    def work(worker):
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            kind, payload = task
+            try:
+                if errors:
+                    continue        # a task failed: drain the queue and stop
+                if kind == "probe":
+                    shard, bands = probe_band(worker, search_url, currency, payload,
+                                              slider_max, step, cap, search_budget)
+                    for band in bands:
+                        submit(("probe", band))
+                    if shard:
+                        with lock:
+                            shards.append(shard)
+                            index.add_many(shard.records)
+                        for offset in shard.remaining_pages():
+                            submit(("page", worker.results_url(shard.url, offset=offset)))
+                else:
+                    worker.retry_policy.start_search(search_budget)
+                    worker.get(payload)
+                    records = worker.collect_results()
+                    with lock:
+                        index.add_many(records)
+            except Exception as error:
+                with lock:
+                    errors.append(error)
+            finally:
+                finish()
+
+    def run(number):
+        if number == 0:
+            return work(bot)
+        with type(bot)(**booking_kwargs) as worker:
+            return work(worker)
+
+    submit(("probe", (low, high)))
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        list(pool.map(run, range(sessions)))
+
+    if errors:
+        raise errors[0]
+
+    index.shards = sorted(shards, key=lambda shard: shard.low)
+    bot.property_index.merge(index)
+    return index
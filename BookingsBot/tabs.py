@@ -0,0 +1,166 @@
+# Several independent search flows interleaved in the tabs of one browser
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+import BookingsBot.constants as const
+
+
+class TabScheduler:
+    """
+    Runs several flows, each in its own tab of one `Booking` browser.
+
+    A flow is a generator taking the bot. Whenever it has to wait for the page it
+    yields a condition (a callable returning truthy once the tab is ready). The
+    scheduler then switches to the next tab, so one WebDriver session keeps every
+    tab busy instead of blocking on a single page. The value returned by the
+    generator is the flow's result. If a condition is not met within `wait_timeout`
+    seconds a TimeoutException is raised inside the flow.
+
+    The bot must be built with `page_load_strategy="eager"` or `"none"`: with "normal",
+    ChromeDriver waits for a loading tab before any command, so tabs would still load
+    one after another.
+
+    Example:
+        def flow(bot):
+            bot.navigate_async(url)
+            yield lambda: bot.find_elements(By.CSS_SELECTOR, 'div[data-testid="property-card"]')
+            return bot.collect_results()
+    """
+
+    def __init__(self, bot, poll_interval: float = 0.2, wait_timeout: float = None):
+        self.bot = bot
+        self.poll_interval = poll_interval
+        self.wait_timeout = wait_timeout or const.TAB_WAIT_TIMEOUT
+        self._flows = []
+
+
+    def add(self, flow, *args, **kwargs):
+        """
+        Queues `flow(bot, *args, **kwargs)` to run in a new tab.
+
+        Returns:
+            int: Position of the flow's result in the list returned by `run`.
+        """
+        self._flows.append((flow, args, kwargs))
+        return len(self._flows) - 1
+
+
+    def run(self):
+        """
+        Opens one tab per flow and interleaves them until all are finished.
+        Tabs are closed when their flow ends.
+
+        Returns:
+            list: One result per flow, in the order they were added. A flow that
+            raised has its exception in place of a result.
+        """
+        bot = self.bot
+        if bot.page_load_strategy not in const.TAB_PAGE_LOAD_STRATEGIES:
+            raise ValueError(f"Tab mode needs Booking(page_load_strategy=...) set to one of "
+                             f"{const.RED}{const.BOLD}{const.TAB_PAGE_LOAD_STRATEGIES}{const.RESET}, "
+                             f"not {const.RED}{const.BOLD}'{bot.page_load_strategy}'{const.RESET}")
+        home = bot.current_window_handle
+        results = [None] * len(self._flows)
+        tasks = []
+
+        bot.implicitly_wait(0)   # readiness checks must not block on other tabs
+        try:
+            for number, (flow, args, kwargs) in enumerate(self._flows):
+                bot.switch_to.new_window("tab")
+                task = {"number": number, "handle": bot.current_window_handle,
+                        "condition": None, "since": time.monotonic()}
+                try:
+                    task["generator"] = flow(bot, *args, **kwargs)
+                except Exception as error:
+                    results[number] = error
+                    self._close(task, [])
+                    continue
+                tasks.append(task)
+
+            while tasks:
+                progressed = False
+                for task in list(tasks):
+                    bot.switch_to.window(task["handle"])
+                    try:
+                        if task["condition"] is not None:
+                            try:
+                                ready = task["condition"]()
+                            except Exception:
+                                ready = False
+                            if not ready:
+                                if time.monotonic() - task["since"] < self.wait_timeout:
+                                    continue
+                                task["condition"] = task["generator"].throw(TimeoutException(
+                                    f"Tab {task['number']} did not become ready in {self.wait_timeout}s"))
+                            else:
+                                task["condition"] = task["generator"].send(ready)
+                        else:
+                            task["condition"] = next(task["generator"])
+                        task["since"] = time.monotonic()
+                        progressed = True
+                    except StopIteration as done:
+                        results[task["number"]] = done.value
+                        self._close(task, tasks)
+                        progressed = True
+                    except Exception as error:
+                        results[task["number"]] = error
+                        self._close(task, tasks)
+                        progressed = True
+
+                if not progressed:
+                    time.sleep(self.poll_interval)
+        finally:
+            for task in tasks:
+                task["generator"].close()
+                self._close(task, [])
+            bot.switch_to.window(home)
+            bot.implicitly_wait(bot.implicit_wait)
+            self._flows = []
+
+        return results
+
+
+    def _close(self, task, tasks):
+        if task in tasks:
+            tasks.remove(task)
+        try:
+            self.bot.switch_to.window(task["handle"])
+            self.bot.close()
+        except Exception:
+            pass
+
+
+def check_source(source):
+    """
+    Raises:
+        ValueError: If `source` is not "dom": the performance log used for network
+            extraction belongs to the whole browser, so payloads cannot be told
+            apart between tabs.
+    """
+    if source not in (None, "dom"):
+        raise ValueError(f"Tab mode can only read results from the {const.RED}{const.BOLD}'dom'{const.RESET}, not {const.RED}{const.BOLD}'{source}'{const.RESET}")
+
+
+def search_flow(bot, url: str, source=None):
+    """
+    Tab flow: loads a configured results URL and reads its properties from the DOM.
+    `source` is checked with `check_source`.
+
+    Returns:
+        Generator whose return value is a list of dict, as from `Booking.collect_results`.
+    """
+    check_source(source)
+    return _search_steps(bot, url)
+
+
+def _search_steps(bot, url: str):
+    start = time.monotonic()
+    bot.navigate_async(url)
+    yield lambda: bot.find_elements(By.CSS_SELECTOR, f'div[data-testid="property-card"], {const.CHALLENGE_SELECTOR}')
+
+    challenged = bot.is_challenge_page()
+    if bot.governor:
+        bot.governor.report(time.monotonic() - start, challenged=challenged)
+    if challenged:
+        raise TimeoutException(f"{const.RED}{const.BOLD}Challenge page served for {url}{const.RESET}")
+    return bot.collect_results("dom")
@@ -1,12 +1,28 @@
-from BookingsBot.booking import Booking
+import argparse
 import BookingsBot.constants as const
 
 # This is a context manager and will automatically exit if the condition is satisfied
 def main():
+    parser = argparse.ArgumentParser(description="Booking.com Interactive CLI")
+    parser.add_argument("--refresh-driver", action="store_true",
+                        help="Re-resolve ChromeDriver for the installed Chrome and update the cache, then exit.")
+    parser.add_argument("--user-data-dir", default=None,
+                        help="Reuse an existing Chrome user-data directory.")
+    args = parser.parse_args()
+
+    if args.refresh_driver:
+        from BookingsBot.driver_cache import resolve_driver
+        resolved = resolve_driver(refresh=True)
+        print(f"ChromeDriver {resolved['driver_path']} (Chrome {resolved['browser_version']})")
+        return
+
     print("\n=== Booking.com Interactive CLI ===\n")
 
+    # Selenium is only imported once a browser is actually needed
+    from BookingsBot.booking import Booking
+
     # Start browser session
-    with Booking(teardown=False) as bot:
+    with Booking(teardown=False, user_data_dir=args.user_data_dir) as bot:
         bot.land_first_page()
 
         # Currency
@@ -0,0 +1,93 @@
+import pytest
+import BookingsBot.governor as governor
+from BookingsBot.governor import RateGovernor
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(governor.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "governor.json")
+
+
+def test_burst_is_served_without_waiting(clock, path):
+    rate = RateGovernor(path, rate=2.0, burst=3.0)
+    for _ in range(3):
+        rate.acquire(sleep=clock.sleep)
+    assert clock.slept == []
+
+    rate.acquire(sleep=clock.sleep)
+    assert clock.slept == [pytest.approx(0.5)]
+    assert rate.stats()["queue_depth"] == 0
+
+
+def test_tokens_refill_up_to_the_burst(clock, path):
+    rate = RateGovernor(path, rate=1.0, burst=2.0)
+    rate.acquire(2.0, sleep=clock.sleep)
+    clock.now += 60
+    assert rate.stats()["tokens"] == 2.0
+
+
+def test_instances_on_one_file_share_the_bucket(clock, path):
+    first = RateGovernor(path, rate=1.0, burst=1.0)
+    second = RateGovernor(path, rate=1.0, burst=1.0)
+    first.acquire(sleep=clock.sleep)
+    second.acquire(sleep=clock.sleep)
+    assert clock.slept == [pytest.approx(1.0)]
+
+
+def test_report_adapts_the_rate(clock, path):
+    rate = RateGovernor(path, rate=1.0, min_rate=0.1, max_rate=1.1, slow_latency=5)
+
+    rate.report(1.0)
+    assert rate.stats()["rate"] == pytest.approx(1.05)
+    rate.report(1.0)
+    rate.report(1.0)
+    assert rate.stats()["rate"] == pytest.approx(1.1)
+
+    rate.report(6.0)
+    assert rate.stats()["rate"] == pytest.approx(0.88)
+
+    rate.report(1.0, challenged=True)
+    stats = rate.stats()
+    assert stats["rate"] == pytest.approx(0.44)
+    assert stats["tokens"] == 0
+
+    for _ in range(10):
+        rate.report(1.0, challenged=True)
+    assert rate.stats()["rate"] == pytest.approx(0.1)
+
+
+def test_interrupted_wait_leaves_the_queue(clock, path):
+    rate = RateGovernor(path, rate=1.0, burst=1.0)
+    rate.acquire(sleep=clock.sleep)
+
+    def interrupted(seconds):
+        assert rate.stats()["queue_depth"] == 1
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        rate.acquire(sleep=interrupted)
+    assert rate.stats()["queue_depth"] == 0
+
+
+def test_shared_returns_one_instance_per_file(path):
+    assert RateGovernor.shared(path) is RateGovernor.shared(path)
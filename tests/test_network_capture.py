@@ -0,0 +1,112 @@
+import json
+from BookingsBot.network_capture import (
+    decode_property, find_property_items, results_payload_requests, NetworkCapture,
+)
+
+
+ITEM = {
+    "displayName": {"text": "Le Petit"},
+    "basicPropertyData": {
+        "id": 42,
+        "pageName": "le-petit",
+        "location": {"countryCode": "fr", "latitude": 48.8, "longitude": 2.3},
+        "reviews": {"totalScore": 8.7, "reviewsCount": 120},
+    },
+    "priceDisplayInfoIrene": {
+        "displayPrice": {"amountPerStay": {"amount": "€ 240", "amountUnformatted": 240.0, "currency": "EUR"}},
+    },
+}
+
+
+def log_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def navigated(loader_id, parent=None):
+    frame = {"loaderId": loader_id}
+    if parent:
+        frame["parentId"] = parent
+    return log_entry("Page.frameNavigated", frame=frame)
+
+
+def response(request_id, loader_id, url="https://www.booking.com/dml/graphql", mime="application/json"):
+    return log_entry("Network.responseReceived", requestId=request_id, loaderId=loader_id,
+                     response={"url": url, "mimeType": mime})
+
+
+def test_decode_property():
+    record = decode_property(ITEM)
+    assert record["name"] == "Le Petit"
+    assert record["url"] == "https://www.booking.com/hotel/fr/le-petit.html"
+    assert record["property_id"] == "fr/le-petit"
+    assert record["price"] == "€ 240"
+    assert record["price_value"] == 240.0
+    assert record["score_value"] == 8.7
+    assert record["review_score"] == "8.7"
+    assert record["tax_info"] == "N/A"
+
+
+def test_decode_property_without_location_has_no_id():
+    record = decode_property({"basicPropertyData": {"id": 1}})
+    assert record["url"] is None
+    assert record["property_id"] is None
+    assert record["name"] == "N/A"
+
+
+def test_find_property_items_walks_nested_payloads():
+    payload = {"data": {"searchQueries": {"search": {"results": [ITEM, {"other": 1}, ITEM]}}}}
+    assert len(list(find_property_items(payload))) == 2
+
+
+def test_results_payload_requests_filters_url_and_mime_type():
+    log = [navigated("L1"),
+           response("1", "L1"),
+           response("2", "L1", url="https://www.booking.com/other"),
+           response("3", "L1", mime="text/html"),
+           log_entry("Network.requestWillBeSent", requestId="4")]
+    assert results_payload_requests(log) == (["1"], "L1")
+
+
+def test_main_frame_navigation_drops_earlier_responses():
+    log = [navigated("L1"), response("1", "L1"),
+           navigated("L2"), response("2", "L1"), response("3", "L2"),
+           navigated("F1", parent="main"), response("4", "L2")]
+    assert results_payload_requests(log) == (["3", "4"], "L2")
+
+
+def test_known_loader_filters_responses_of_other_documents():
+    log = [response("1", "L1"), response("2", "L2")]
+    assert results_payload_requests(log, "L2") == (["2"], "L2")
+
+
+class FakeDriver:
+    def __init__(self, log, bodies):
+        self.log = log
+        self.bodies = bodies
+
+    def get_log(self, kind):
+        log, self.log = self.log, []
+        return log
+
+    def execute_cdp_cmd(self, command, params):
+        return {"body": self.bodies[params["requestId"]]}
+
+
+def test_network_capture_keeps_results_of_the_current_document():
+    payload = json.dumps({"results": [ITEM]})
+    driver = FakeDriver([navigated("L1"), response("1", "L1"), response("2", "L1")],
+                        {"1": payload, "2": "not json"})
+    capture = NetworkCapture()
+    assert [record["property_id"] for record in capture.results(driver)] == ["fr/le-petit"]
+    # The log is drained: the same document keeps its decoded results
+    assert len(capture.results(driver)) == 1
+
+    driver.log = [navigated("L2")]
+    assert capture.results(driver) == []
+
+
+def test_network_capture_reset_drops_logged_payloads():
+    driver = FakeDriver([navigated("L1"), response("1", "L1")], {"1": json.dumps([ITEM])})
+    capture = NetworkCapture()
+    capture.reset(driver)
+    assert capture.results(driver) == []
@@ -0,0 +1,57 @@
+import struct
+import pytest
+from BookingsBot.price_matrix import PriceMatrix
+
+
+COLUMNS = [("2026-12-01", 2), ("2026-12-01", 3), ("2026-12-02", 2)]
+
+
+def test_missing_prices_read_as_none():
+    matrix = PriceMatrix(COLUMNS)
+    matrix.set("fr/le-petit", ("2026-12-01", 3), 120.5)
+    assert matrix.row("fr/le-petit") == [None, 120.5, None]
+    assert matrix.get("fr/unknown", ("2026-12-01", 2)) is None
+    with pytest.raises(KeyError):
+        matrix.get("fr/le-petit", ("2026-12-09", 1))
+
+
+def test_merge_keeps_rows_of_both_matrices():
+    left, right = PriceMatrix(COLUMNS), PriceMatrix(COLUMNS)
+    left.set("a", ("2026-12-01", 2), 10)
+    right.set("a", ("2026-12-02", 2), 12)
+    right.set("b", ("2026-12-01", 3), 30)
+    left.merge(right)
+    assert left.row("a") == [10, None, 12]
+    assert left.row("b") == [None, 30, None]
+
+    with pytest.raises(ValueError):
+        left.merge(PriceMatrix(COLUMNS[:1]))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    matrix = PriceMatrix(COLUMNS)
+    matrix.set("fr/le-petit", ("2026-12-01", 2), 99.99)
+    matrix.set("it/casa", ("2026-12-02", 2), 1500)
+    path = tmp_path / "prices.bkpm"
+    matrix.save(str(path))
+
+    loaded = PriceMatrix.load(str(path))
+    assert loaded.columns == COLUMNS
+    assert loaded.properties == ["fr/le-petit", "it/casa"]
+    assert loaded.row("fr/le-petit") == [99.99, None, None]
+    assert loaded.row("it/casa") == [None, None, 1500]
+
+
+def test_saved_floats_are_little_endian(tmp_path):
+    matrix = PriceMatrix(COLUMNS[:1])
+    matrix.set("a", COLUMNS[0], 1.5)
+    path = tmp_path / "prices.bkpm"
+    matrix.save(str(path))
+    assert path.read_bytes()[-8:] == struct.pack("<d", 1.5)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        PriceMatrix.load(str(path))
@@ -0,0 +1,55 @@
+import pytest
+from BookingsBot.property_index import PropertyIndex, property_id_from_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.booking.com/hotel/fr/le-petit.en-gb.html?aid=1&ucfs=1", "fr/le-petit"),
+    ("https://www.booking.com/hotel/FR/Le-Petit.html", "fr/le-petit"),
+    ("https://www.booking.com/searchresults.html?ss=Paris", None),
+    ("", None),
+    (None, None),
+])
+def test_property_id_from_url(url, expected):
+    assert property_id_from_url(url) == expected
+
+
+def test_add_keeps_the_latest_observation():
+    index = PropertyIndex()
+    assert index.add({"property_id": "fr/a", "price": "10", "observed_at": 1})
+    assert not index.add({"property_id": "fr/a", "price": "12", "observed_at": 2})
+    assert not index.add({"property_id": "fr/a", "price": "8", "observed_at": 0})
+    assert len(index) == 1
+    assert index.get("fr/a")["price"] == "12"
+
+
+def test_records_without_id_are_skipped():
+    index = PropertyIndex()
+    assert not index.add({"name": "Hotel", "property_id": None})
+    assert len(index) == 0
+
+
+def test_add_stores_a_copy():
+    record = {"property_id": "fr/a", "price": "10"}
+    index = PropertyIndex([record])
+    assert "observed_at" not in record
+    record["price"] = "99"
+    assert index.get("fr/a")["price"] == "10"
+
+
+def test_add_many_returns_new_records_and_merge_combines():
+    index = PropertyIndex([{"property_id": "fr/a", "observed_at": 1}])
+    new = index.add_many([{"property_id": "fr/a", "observed_at": 2},
+                          {"property_id": "fr/b", "observed_at": 2}])
+    assert [record["property_id"] for record in new] == ["fr/b"]
+
+    other = PropertyIndex([{"property_id": "fr/c", "observed_at": 3}])
+    index.merge(other)
+    assert sorted(record["property_id"] for record in index) == ["fr/a", "fr/b", "fr/c"]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = PropertyIndex([{"property_id": "fr/a", "name": "Café", "observed_at": 1.5}])
+    path = tmp_path / "index.jsonl.gz"
+    index.save(str(path))
+    loaded = PropertyIndex.load(str(path))
+    assert loaded.records() == index.records()
@@ -0,0 +1,152 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+import BookingsBot.retry as retry
+from BookingsBot.retry import RetryPolicy, DeadlineExceeded, CircuitOpenError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(retry.time, "monotonic", clock)
+    monkeypatch.setattr(retry.time, "sleep", clock.sleep)
+    return clock
+
+
+def failing(error, calls):
+    def action():
+        calls.append(1)
+        raise error
+    return action
+
+
+# ---------- DEADLINE ----------
+def test_timeout_is_capped_by_the_time_left(clock):
+    policy = RetryPolicy()
+    policy.start_search(5)
+    assert policy.timeout(10) == 5
+    assert policy.timeout(2) == 2
+
+    clock.now += 4
+    assert policy.timeout(10) == pytest.approx(1)
+
+
+def test_timeout_raises_once_the_budget_is_used_up(clock):
+    policy = RetryPolicy()
+    policy.start_search(5)
+    clock.now += 5
+    with pytest.raises(DeadlineExceeded):
+        policy.timeout(1)
+    with pytest.raises(DeadlineExceeded):
+        policy.sleep(1)
+
+
+def test_start_search_without_budget_keeps_the_running_deadline(clock):
+    policy = RetryPolicy()
+    policy.start_search(5)
+    clock.now += 3
+    policy.start_search()
+    assert policy.remaining() == pytest.approx(2)
+
+    policy.end_search()
+    assert policy.timeout(10) == 10
+
+
+def test_sleep_stops_at_the_deadline(clock):
+    policy = RetryPolicy()
+    policy.start_search(1)
+    policy.sleep(10)
+    assert policy.remaining() == 0
+
+
+# ---------- RETRYABLE / FATAL ----------
+def test_retryable_errors_are_retried_until_success(clock):
+    policy = RetryPolicy(retries=3)
+    calls = []
+
+    def action():
+        calls.append(1)
+        if len(calls) < 3:
+            raise StaleElementReferenceException()
+        return "done"
+
+    assert policy.run(action) == "done"
+    assert len(calls) == 3
+
+
+def test_retryable_error_is_raised_after_the_last_attempt(clock):
+    policy = RetryPolicy(retries=3)
+    calls = []
+    with pytest.raises(TimeoutException):
+        policy.run(failing(TimeoutException(), calls))
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize("error", [ValueError("bad"), DeadlineExceeded(), CircuitOpenError()])
+def test_fatal_errors_are_not_retried(clock, error):
+    policy = RetryPolicy(retries=3)
+    calls = []
+    with pytest.raises(type(error)):
+        policy.run(failing(error, calls))
+    assert len(calls) == 1
+
+
+def test_run_stops_when_the_deadline_passes_between_attempts(clock):
+    policy = RetryPolicy(retries=5, base_delay=2, jitter=0)
+    policy.start_search(3)
+    calls = []
+    with pytest.raises(DeadlineExceeded):
+        policy.run(failing(StaleElementReferenceException(), calls))
+    assert len(calls) == 2
+
+
+# ---------- CIRCUIT BREAKER ----------
+def test_breaker_opens_and_half_opens_after_the_cooldown(clock):
+    policy = RetryPolicy(retries=1, breaker_threshold=2, breaker_cooldown=60)
+    key = ("css selector", "button")
+    calls = []
+    flaky = failing(StaleElementReferenceException(), calls)
+
+    for _ in range(2):
+        with pytest.raises(StaleElementReferenceException):
+            policy.run(flaky, key=key)
+
+    # Open: fails at once without calling the action
+    with pytest.raises(CircuitOpenError):
+        policy.run(flaky, key=key)
+    assert len(calls) == 2
+
+    # Half-open: one try is let through, and a failure opens the breaker again
+    clock.now += 60
+    with pytest.raises(StaleElementReferenceException):
+        policy.run(flaky, key=key)
+    assert len(calls) == 3
+    with pytest.raises(CircuitOpenError):
+        policy.run(flaky, key=key)
+
+    # A success while half-open closes it
+    clock.now += 60
+    assert policy.run(lambda: "ok", key=key) == "ok"
+    with pytest.raises(StaleElementReferenceException):
+        policy.run(flaky, key=key)
+    assert policy.run(lambda: "ok", key=key) == "ok"
+
+
+def test_breaker_only_tracks_its_own_key(clock):
+    policy = RetryPolicy(retries=1, breaker_threshold=1)
+    with pytest.raises(StaleElementReferenceException):
+        policy.run(failing(StaleElementReferenceException(), []), key="a")
+    with pytest.raises(CircuitOpenError):
+        policy.run(lambda: "ok", key="a")
+    assert policy.run(lambda: "ok", key="b") == "ok"
+    assert policy.run(lambda: "ok") == "ok"
@@ -0,0 +1,55 @@
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from BookingsBot.booking import Booking
+from BookingsBot.sharding import PriceShard, active_price_band, price_band_url, split_band
+
+
+SEARCH_URL = ("https://www.booking.com/searchresults.html?ss=Paris&offset=50"
+              "&nflt=class%3D4%3Bprice%3DEUR-50-200-1")
+
+
+def query(url):
+    return {key: values[0] for key, values in parse_qs(urlsplit(url).query).items()}
+
+
+def test_split_band_cuts_in_proportion_to_the_count():
+    assert split_band(0, 300, 3000, 1000, 10, 1000) == [(0, 100), (100, 200), (200, 300)]
+
+
+def test_split_band_splits_at_least_in_two_and_keeps_the_open_top():
+    assert split_band(0, None, 1000, 400, 10, 1000) == [(0, 200), (200, None)]
+
+
+def test_split_band_widths_stay_on_the_slider_step():
+    for low, high in split_band(0, 95, 5000, 500, 10, 1000):
+        assert low % 10 == 0
+
+
+def test_single_step_band_cannot_be_split():
+    assert split_band(100, 110, 5000, 500, 10, 1000) == []
+    assert split_band(490, None, 5000, 500, 10, 1000) == []
+
+
+@pytest.mark.parametrize("url, expected", [
+    (SEARCH_URL, ("EUR", 50, 200)),
+    ("https://www.booking.com/searchresults.html?nflt=price%3DUSD-100-max-1", ("USD", 100, None)),
+    ("https://www.booking.com/searchresults.html?ss=Paris&nflt=class%3D4", None),
+    ("https://www.booking.com/searchresults.html?ss=Paris", None),
+])
+def test_active_price_band(url, expected):
+    assert active_price_band(url) == expected
+
+
+def test_price_band_url_replaces_only_the_price_filter():
+    bot = Booking.__new__(Booking)
+    params = query(price_band_url(bot, SEARCH_URL, "EUR", 100, None))
+    assert params["nflt"] == "class=4;price=EUR-100-max-1"
+    assert params["selected_currency"] == "EUR"
+    assert params["ss"] == "Paris"
+    assert "offset" not in params
+
+
+def test_remaining_pages_stop_at_the_cap():
+    assert PriceShard(0, 10, "", 60, []).remaining_pages() == [25, 50]
+    assert PriceShard(0, 10, "", 10, []).remaining_pages() == []
+    assert PriceShard(0, 10, "", 5000, []).remaining_pages()[-1] == 975
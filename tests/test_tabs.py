@@ -0,0 +1,63 @@
+import pytest
+from BookingsBot.tabs import TabScheduler, search_flow
+
+
+class SwitchTo:
+    def __init__(self, bot):
+        self.bot = bot
+
+    def new_window(self, kind):
+        self.bot.opened += 1
+        self.bot.current_window_handle = f"tab{self.bot.opened}"
+        self.bot.open.add(self.bot.current_window_handle)
+
+    def window(self, handle):
+        self.bot.current_window_handle = handle
+
+
+class FakeBot:
+    page_load_strategy = "eager"
+    implicit_wait = 0
+
+    def __init__(self):
+        self.current_window_handle = "home"
+        self.opened = 0
+        self.open = set()
+        self.switch_to = SwitchTo(self)
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def close(self):
+        self.open.discard(self.current_window_handle)
+
+
+def test_flows_run_in_their_own_tabs_which_are_closed():
+    def flow(bot, value):
+        yield lambda: True
+        return value, bot.current_window_handle
+
+    bot = FakeBot()
+    scheduler = TabScheduler(bot, poll_interval=0)
+    scheduler.add(flow, "a")
+    scheduler.add(flow, "b")
+    assert scheduler.run() == [("a", "tab1"), ("b", "tab2")]
+    assert bot.open == set()
+    assert bot.current_window_handle == "home"
+
+
+def test_flow_failing_to_start_closes_its_tab():
+    bot = FakeBot()
+    scheduler = TabScheduler(bot)
+    scheduler.add(search_flow, "https://www.booking.com/searchresults.html", "network")
+    [result] = scheduler.run()
+    assert isinstance(result, ValueError)
+    assert bot.open == set()
+
+
+def test_normal_page_load_strategy_is_rejected():
+    bot = FakeBot()
+    bot.page_load_strategy = "normal"
+    with pytest.raises(ValueError):
+        TabScheduler(bot).run()
+    assert bot.opened == 0